@@ -681,7 +681,7 @@ async def _run_interactive_mode(
 
     # Per-file (name, status) pairs preserve input order for the completion
     # overview. Statuses mirror FileProcessor.process_file:
-    # complete | partial | failed | skipped.
+    # complete | partial | failed | skipped | submitted (auto-batched).
     file_statuses: list[tuple[str, str]] = []
 
     # Chunking modes that prompt mid-run ("auto-adjust" line-range editing,
@@ -789,6 +789,7 @@ async def _run_interactive_mode(
     partial = sum(1 for _, s in file_statuses if s == "partial")
     failed = sum(1 for _, s in file_statuses if s == "failed")
     skipped = sum(1 for _, s in file_statuses if s == "skipped")
+    submitted = sum(1 for _, s in file_statuses if s == "submitted")
     failed_files = [n for n, s in file_statuses if s == "failed"]
     partial_files = [n for n, s in file_statuses if s == "partial"]
 
@@ -814,6 +815,7 @@ async def _run_interactive_mode(
         complete_count=complete,
         partial_count=partial,
         skipped_count=skipped,
+        submitted_count=submitted,
         failed_files=failed_files,
         partial_files=partial_files,
         tokens_this_run=tokens_this_run,
@@ -1240,6 +1242,9 @@ async def _run_cli_mode(
     partial = sum(1 for s in statuses if s == "partial")
     failed = sum(1 for s in statuses if s == "failed")
     skipped = sum(1 for s in statuses if s == "skipped")
+    # Files routed to the batch API by chunking.auto_batch_threshold: submitted,
+    # not yet extracted.
+    submitted = sum(1 for s in statuses if s == "submitted")
 
     # Final summary
     logger.info("Processing complete")
@@ -1251,7 +1256,10 @@ async def _run_cli_mode(
             print(
                 f"[SUCCESS] Processed {len(files)} file(s): "
                 f"{complete} complete, {partial} partial, {failed} failed"
+                + (f", {submitted} submitted as batch" if submitted else "")
             )
+            if submitted:
+                print("[INFO] Run 'python main/check_batches.py' to check status")
 
     # Final token usage statistics
     tokens_used_today = 0
@@ -1281,7 +1289,8 @@ async def _run_cli_mode(
                     "partial": partial,
                     "failed": failed,
                     "skipped": skipped,
-                    "batch": use_batch,
+                    "submitted": submitted,
+                    "batch": use_batch or bool(submitted),
                     "tokens_used_today": tokens_used_today,
                 },
                 ensure_ascii=False,
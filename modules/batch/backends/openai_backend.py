@@ -6,6 +6,7 @@ Uses OpenAI's Batch API with the /v1/responses endpoint for async text extractio
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
 import logging
 import tempfile
@@ -23,6 +24,7 @@ from modules.batch.backends.base import (
 )
 from modules.config.capabilities import detect_capabilities
 from modules.config.loader import resolve_api_key
+from modules.infra.jsonl import fast_json_dumps
 from modules.llm.schema_utils import build_structured_text_format
 
 logger = logging.getLogger(__name__)
@@ -37,29 +39,24 @@ MAX_BATCH_BYTES = 150 * 1024 * 1024  # 150 MB safety margin (limit is 200MB)
 # meaning here and is remapped to ``auto`` in _apply_service_tier.
 _ALLOWED_SERVICE_TIERS = {"auto", "default", "priority"}
 
-# The remap is decided per request body, but the operator only needs to hear
-# it once per submission; reset at the top of submit_batch.
-_flex_remap_logged = False
 
-
-def _apply_service_tier(body: dict[str, Any], tm: dict[str, Any]) -> None:
+def _apply_service_tier(body: dict[str, Any], tm: dict[str, Any]) -> bool:
     """Set ``service_tier`` on a Responses body from model config, if valid.
 
-    The Batch API rejects ``flex``; it is mapped to ``auto``. Any other value
-    outside the allowed set is ignored.
+    The Batch API rejects ``flex``; it is mapped to ``auto`` and True is
+    returned so the caller can report the remap. Any other value outside the
+    allowed set is ignored.
     """
-    global _flex_remap_logged
     effective_service_tier = tm.get("service_tier")
     if not effective_service_tier:
-        return
+        return False
     tier_str = str(effective_service_tier)
     if tier_str == "flex":
-        if not _flex_remap_logged:
-            logger.info("Batch API does not support service_tier='flex'. Using 'auto'.")
-            _flex_remap_logged = True
         body["service_tier"] = "auto"
-    elif tier_str in _ALLOWED_SERVICE_TIERS:
+        return True
+    if tier_str in _ALLOWED_SERVICE_TIERS:
         body["service_tier"] = tier_str
+    return False
 
 
 def _apply_reasoning(body: dict[str, Any], tm: dict[str, Any], caps: Any) -> None:
@@ -78,15 +75,34 @@ def _apply_sampler_controls(
                 body[k] = tm[k]
 
 
-def _build_responses_body(
+def _prompt_cache_key(system_prompt: str, schema: dict[str, Any] | None) -> str:
+    """Stable ``prompt_cache_key`` for requests sharing a system prompt/schema.
+
+    OpenAI's automatic prompt caching matches on the leading tokens of the
+    request; the key additionally routes requests with the same prefix to the
+    same cache, which matters for a batch whose every body starts with the
+    identical system message.
+    """
+    digest = hashlib.sha256(system_prompt.encode("utf-8"))
+    if schema:
+        digest.update(json.dumps(schema, sort_keys=True).encode("utf-8"))
+    return f"chronominer-{digest.hexdigest()[:32]}"
+
+
+def _build_body_skeleton(
     *,
     model_config: dict[str, Any],
     system_prompt: str,
-    user_text: str,
     schema: dict[str, Any] | None = None,
     schema_name: str | None = None,
 ) -> dict[str, Any]:
-    """Construct a Responses API request body for text extraction."""
+    """Construct the request-invariant part of a Responses API body.
+
+    Everything except the user message depends only on the model config,
+    system prompt and schema, so a batch builds it once and splices each
+    request's user content in with ``_with_user_content``. The ``input`` list
+    holds the system message followed by an empty user message.
+    """
     tm = model_config.get("extraction_model", {}) or model_config
     model_name: str = tm.get("name", "gpt-4o-2024-08-06")
     caps = detect_capabilities(model_name)
@@ -99,12 +115,7 @@ def _build_responses_body(
                 "role": "system",
                 "content": [{"type": "input_text", "text": system_prompt}],
             },
-            {
-                "role": "user",
-                "content": [
-                    {"type": "input_text", "text": f"Input text:\n{user_text}"},
-                ],
-            },
+            {"role": "user", "content": []},
         ],
         "max_output_tokens": BatchBackend._clamp_max_output_tokens(
             int(
@@ -117,8 +128,13 @@ def _build_responses_body(
         ),
     }
 
-    # Service tier handling
-    _apply_service_tier(body, tm)
+    if system_prompt:
+        body["prompt_cache_key"] = _prompt_cache_key(system_prompt, schema)
+
+    # Service tier handling. The skeleton is built once per submission, so
+    # the remap is reported once rather than per request.
+    if _apply_service_tier(body, tm):
+        logger.info("Batch API does not support service_tier='flex'. Using 'auto'.")
 
     # Structured outputs
     if schema and caps.supports_structured_outputs:
@@ -138,6 +154,55 @@ def _build_responses_body(
     return body
 
 
+def _with_user_content(
+    skeleton: dict[str, Any], content: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Return a body sharing *skeleton*'s fields, with *content* as user input.
+
+    The skeleton's nested values are shared rather than copied; bodies are
+    only serialized, never mutated.
+    """
+    body = dict(skeleton)
+    body["input"] = [skeleton["input"][0], {"role": "user", "content": content}]
+    return body
+
+
+def _text_user_content(user_text: str) -> list[dict[str, Any]]:
+    """User message content for a text extraction request."""
+    return [{"type": "input_text", "text": f"Input text:\n{user_text}"}]
+
+
+def _image_user_content(
+    image_base64: str, mime_type: str, image_detail: str | None = None
+) -> list[dict[str, Any]]:
+    """User message content for a visual extraction request."""
+    return [
+        {
+            "type": "input_image",
+            "image_url": f"data:{mime_type};base64,{image_base64}",
+            "detail": image_detail or "auto",
+        }
+    ]
+
+
+def _build_responses_body(
+    *,
+    model_config: dict[str, Any],
+    system_prompt: str,
+    user_text: str,
+    schema: dict[str, Any] | None = None,
+    schema_name: str | None = None,
+) -> dict[str, Any]:
+    """Construct a Responses API request body for text extraction."""
+    skeleton = _build_body_skeleton(
+        model_config=model_config,
+        system_prompt=system_prompt,
+        schema=schema,
+        schema_name=schema_name,
+    )
+    return _with_user_content(skeleton, _text_user_content(user_text))
+
+
 def _build_image_responses_body(
     *,
     model_config: dict[str, Any],
@@ -149,61 +214,15 @@ def _build_image_responses_body(
     schema_name: str | None = None,
 ) -> dict[str, Any]:
     """Construct a Responses API request body for visual extraction."""
-    tm = model_config.get("extraction_model", {}) or model_config
-    model_name: str = tm.get("name", "gpt-4o-2024-08-06")
-    caps = detect_capabilities(model_name)
-
-    detail = image_detail or "auto"
-    data_url = f"data:{mime_type};base64,{image_base64}"
-
-    body: dict[str, Any] = {
-        "model": model_name,
-        "input": [
-            {
-                "role": "system",
-                "content": [{"type": "input_text", "text": system_prompt}],
-            },
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "input_image",
-                        "image_url": data_url,
-                        "detail": detail,
-                    }
-                ],
-            },
-        ],
-        "max_output_tokens": BatchBackend._clamp_max_output_tokens(
-            int(
-                tm.get("max_output_tokens")
-                or tm.get("max_completion_tokens")
-                or tm.get("max_tokens", 4096)
-            ),
-            caps,
-            model_name,
-        ),
-    }
-
-    # Service tier handling (same logic as text)
-    _apply_service_tier(body, tm)
-
-    # Structured outputs
-    if schema and caps.supports_structured_outputs:
-        fmt = build_structured_text_format(
-            schema, schema_name or "ExtractionSchema", True
-        )
-        if fmt is not None:
-            body.setdefault("text", {})
-            body["text"]["format"] = fmt
-
-    # Reasoning controls for reasoning models
-    _apply_reasoning(body, tm, caps)
-
-    # Sampler controls
-    _apply_sampler_controls(body, tm, caps)
-
-    return body
+    skeleton = _build_body_skeleton(
+        model_config=model_config,
+        system_prompt=system_prompt,
+        schema=schema,
+        schema_name=schema_name,
+    )
+    return _with_user_content(
+        skeleton, _image_user_content(image_base64, mime_type, image_detail)
+    )
 
 
 class OpenAIBatchBackend(BatchBackend):
@@ -245,59 +264,55 @@ class OpenAIBatchBackend(BatchBackend):
         schema_name: str | None = None,
     ) -> BatchHandle:
         """Submit a batch to OpenAI's Batch API."""
-        global _flex_remap_logged
         client = self._get_client()
 
-        # One flex-remap notice per submission, not per request body.
-        _flex_remap_logged = False
-
-        # Build JSONL content
-        jsonl_lines = []
-        for req in requests:
-            # Route by input type: visual or text
-            if req.is_visual:
-                assert req.image_base64 is not None, (
-                    "image_base64 required for visual batch requests"
-                )
-                assert req.mime_type is not None, (
-                    "mime_type required for visual batch requests"
-                )
-                body = _build_image_responses_body(
-                    model_config=model_config,
-                    system_prompt=system_prompt,
-                    image_base64=req.image_base64,
-                    mime_type=req.mime_type,
-                    image_detail=req.image_detail,
-                    schema=schema,
-                    schema_name=schema_name,
-                )
-            else:
-                body = _build_responses_body(
-                    model_config=model_config,
-                    system_prompt=system_prompt,
-                    user_text=req.text,
-                    schema=schema,
-                    schema_name=schema_name,
-                )
-
-            request_line = {
-                "custom_id": req.custom_id,
-                "method": "POST",
-                "url": "/v1/responses",
-                "body": body,
-            }
-            jsonl_lines.append(json.dumps(request_line, ensure_ascii=False))
-
-        # Write to temp file. newline="\n" keeps the uploaded JSONL LF-only on
+        # Build JSONL content. Every request shares the model, system prompt
+        # and schema, so the invariant body is built once and only the user
+        # message differs per line.
+        skeleton = _build_body_skeleton(
+            model_config=model_config,
+            system_prompt=system_prompt,
+            schema=schema,
+            schema_name=schema_name,
+        )
+        # Stream each request line straight into the upload file instead of
+        # holding every serialized request (chunk text or base64 page) in
+        # memory first. newline="\n" keeps the uploaded JSONL LF-only on
         # Windows, where text mode would otherwise emit CRLF.
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".jsonl", delete=False, encoding="utf-8", newline="\n"
-        ) as f:
-            for line in jsonl_lines:
-                f.write(line + "\n")
-            temp_path = Path(f.name)
-
+        temp_path: Path | None = None
         try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                suffix=".jsonl",
+                delete=False,
+                encoding="utf-8",
+                newline="\n",
+            ) as f:
+                temp_path = Path(f.name)
+                for req in requests:
+                    # Route by input type: visual or text
+                    if req.is_visual:
+                        assert req.image_base64 is not None, (
+                            "image_base64 required for visual batch requests"
+                        )
+                        assert req.mime_type is not None, (
+                            "mime_type required for visual batch requests"
+                        )
+                        content = _image_user_content(
+                            req.image_base64, req.mime_type, req.image_detail
+                        )
+                    else:
+                        content = _text_user_content(req.text)
+                    body = _with_user_content(skeleton, content)
+
+                    request_line = {
+                        "custom_id": req.custom_id,
+                        "method": "POST",
+                        "url": "/v1/responses",
+                        "body": body,
+                    }
+                    f.write(fast_json_dumps(request_line) + "\n")
+
             # Upload file
             logger.info(
                 "Uploading batch file to OpenAI (%d requests)...", len(requests)
@@ -326,8 +341,9 @@ class OpenAIBatchBackend(BatchBackend):
             )
         finally:
             # Cleanup temp file
-            with contextlib.suppress(Exception):
-                temp_path.unlink()
+            if temp_path is not None:
+                with contextlib.suppress(Exception):
+                    temp_path.unlink()
 
     def get_status(self, handle: BatchHandle) -> BatchStatusInfo:
         """Get status of an OpenAI batch job."""
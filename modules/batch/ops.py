@@ -154,8 +154,9 @@ def _response_to_text(response_obj: Any) -> str:
     if not isinstance(response_obj, dict):
         return ""
 
-    if isinstance(response_obj.get("output_text"), str):
-        return response_obj["output_text"].strip()
+    output_text = response_obj.get("output_text")
+    if isinstance(output_text, str):
+        return output_text.strip()
 
     parts: list[str] = []
     output = response_obj.get("output")
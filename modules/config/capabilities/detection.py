@@ -9,6 +9,7 @@ omission, Responses-API routing) lives in
 
 from __future__ import annotations
 
+import functools
 import logging
 
 from modules.config.capabilities.registry import (
@@ -42,12 +43,15 @@ def _warn_fallback_once(model_name: str, family: str, consequence: str) -> None:
     )
 
 
+@functools.lru_cache(maxsize=64)
 def detect_provider(model_name: str) -> ProviderType:
     """
     Detect LLM provider from model name.
 
     This is the canonical provider detection function. All other modules
-    should use this function or delegate to it.
+    should use this function or delegate to it. The result depends only on
+    the model name, so it is memoized: a run asks about the same handful of
+    models once per file and per extractor.
 
     Args:
         model_name: The model identifier string.
@@ -97,6 +101,13 @@ def detect_capabilities(
     model_name: str,
     provider: ProviderType | None = None,
 ) -> Capabilities:
+    return _resolve_capabilities(model_name, provider == "custom")
+
+
+# Capabilities are immutable and depend only on the name (and whether the
+# provider is "custom"), so every model seen in a run is resolved once.
+@functools.lru_cache(maxsize=64)
+def _resolve_capabilities(model_name: str, is_custom: bool) -> Capabilities:
     m = _norm(model_name)
 
     # Google-native prefixed form ("models/gemini-...", "models/gemma-..."):
@@ -107,7 +118,7 @@ def detect_capabilities(
         m = m.removeprefix("models/")
 
     # --- Custom endpoints: use conservative defaults -------------------------
-    if provider == "custom":
+    if is_custom:
         return _build_caps(model_name, "custom", _CUSTOM_BASE, {})
 
     # --- Static registry lookup (covers OpenAI, Anthropic, Google) ----------
@@ -62,16 +62,21 @@ class BaseConverter(ABC):
         """
         self.schema_name: str = schema_name.lower()
 
-    def get_entries(self, json_file: Path) -> list[Any]:
+    def get_entries(
+        self, json_file: Path, entries: list[Any] | None = None
+    ) -> list[Any]:
         """
         Extract and filter entries from a JSON file.
 
         Uses extract_entries_from_json utility and filters out None values.
 
         :param json_file: Path to the JSON file
+        :param entries: Entries already extracted from *json_file*; when
+            given, the file is not read again
         :return: List of non-None entries
         """
-        entries = extract_entries_from_json(json_file)
+        if entries is None:
+            entries = extract_entries_from_json(json_file)
         return [entry for entry in entries if entry is not None]
 
     @staticmethod
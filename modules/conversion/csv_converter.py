@@ -88,14 +88,16 @@ class CSVConverter(BaseConverter):
         """Convert JSON to CSV format."""
         self.convert_to_csv(json_file, output_file)
 
-    def convert_to_csv(self, json_file: Path, output_csv: Path) -> None:
+    def convert_to_csv(
+        self, json_file: Path, output_csv: Path, entries: list[Any] | None = None
+    ) -> None:
         """Convert JSON entries to a CSV file.
 
         An empty entry list still produces a file so that the CSV, DOCX and
         TXT paths agree: header-only when the schema has a declarative field
-        spec, otherwise an empty file.
+        spec, otherwise an empty file. Pre-extracted *entries* skip the read.
         """
-        entries = self.get_entries(json_file)
+        entries = self.get_entries(json_file, entries)
         if not entries:
             logger.warning("No entries found for CSV conversion.")
 
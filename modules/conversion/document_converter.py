@@ -227,9 +227,11 @@ class DocumentConverter(BaseConverter):
         else:
             logger.warning(f"Unsupported output format: {suffix}")
 
-    def convert_to_docx(self, json_file: Path, output_file: Path) -> None:
-        """Convert JSON entries to a DOCX document."""
-        entries = self.get_entries(json_file)
+    def convert_to_docx(
+        self, json_file: Path, output_file: Path, entries: list[Any] | None = None
+    ) -> None:
+        """Convert JSON entries to a DOCX document; *entries* skip the read."""
+        entries = self.get_entries(json_file, entries)
         document: _DocxDocument = Document()
         document.add_heading(json_file.stem, 0)
         converters = {
@@ -274,9 +276,11 @@ class DocumentConverter(BaseConverter):
         except Exception as e:
             logger.error(f"Error saving DOCX file {output_file}: {e}")
 
-    def convert_to_txt(self, json_file: Path, output_file: Path) -> None:
-        """Convert JSON entries to a plain text file."""
-        entries = self.get_entries(json_file)
+    def convert_to_txt(
+        self, json_file: Path, output_file: Path, entries: list[Any] | None = None
+    ) -> None:
+        """Convert JSON entries to a plain text file; *entries* skip the read."""
+        entries = self.get_entries(json_file, entries)
 
         if not entries:
             logger.warning(f"No valid entries found in {json_file.name}")
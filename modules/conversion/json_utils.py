@@ -138,11 +138,11 @@ def _extract_text_from_api_body(body: Any) -> str:
         return ""
 
     # Responses API normalised shorthand — string form
-    if isinstance(body.get("output_text"), str):
-        return body["output_text"]
+    output_text = body.get("output_text")
+    if isinstance(output_text, str):
+        return output_text
 
     # Responses API normalised shorthand — list form (LangChain provider)
-    output_text = body.get("output_text")
     if isinstance(output_text, list):
         for item in output_text:
             if isinstance(item, dict) and item.get("type") == "text":
@@ -24,6 +24,7 @@ from typing import Any
 from modules.batch.ops import _extract_chunk_index, _order_responses, _response_to_text
 from modules.conversion.json_utils import lean_response
 from modules.extract.resume import METADATA_KEY, build_extraction_metadata
+from modules.infra.jsonl import fast_json_loads
 from modules.infra.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -228,8 +229,8 @@ def merge_existing_batch_output(
     if not existing_output_path.exists():
         return built
     try:
-        data = json.loads(existing_output_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
+        data = fast_json_loads(existing_output_path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
         logger.warning(
             "Could not read existing batch output %s for resume merge: %s. "
             "Keeping newly built records only.",
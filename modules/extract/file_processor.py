@@ -6,6 +6,7 @@ Uses modular components with simplified orchestration and separated concerns.
 """
 
 import asyncio
+import inspect
 import json
 import logging
 import sys
@@ -13,12 +14,14 @@ from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import Any
 
+from modules.batch.backends import supports_batch
+from modules.config.capabilities import detect_provider
 from modules.config.constants import (
     SUPPORTED_PDF_EXTENSIONS,
     SUPPORTED_VISUAL_EXTENSIONS,
 )
 from modules.config.context import resolve_context_for_extraction
-from modules.conversion.json_utils import lean_response
+from modules.conversion.json_utils import extract_entries_from_json, lean_response
 from modules.extract.processing_strategy import create_processing_strategy
 from modules.extract.resume import (
     CHUNKING_TEXT_VERSION,
@@ -39,7 +42,7 @@ from modules.infra.chunking import (
     apply_chunk_slice,
     chunk_slice_indices,
 )
-from modules.infra.jsonl import atomic_write_json
+from modules.infra.jsonl import atomic_write_json, fast_json_loads
 from modules.infra.paths import ensure_path_safe
 from modules.infra.token_tracker import check_and_wait_for_token_limit
 from modules.llm.prompt_utils import (
@@ -61,6 +64,31 @@ _METADATA_KEY = METADATA_KEY
 
 logger = logging.getLogger(__name__)
 
+# Temp JSONL lines carry whole request payloads (base64 page images included),
+# so a 1 MiB read buffer replaces dozens of default-sized reads per line.
+_TEMP_READ_BUFFER = 1 << 20
+
+
+def _accepts_entries(converter: Any) -> bool:
+    """True if a schema handler's ``convert_to_*`` takes pre-parsed entries.
+
+    Custom handlers keep the two-argument ``(json_file, output)`` form.
+    """
+    if converter is None:
+        return False
+    try:
+        return "entries" in inspect.signature(converter).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _file_size(path: Path) -> int:
+    """Size of *path* in bytes from a single stat; 0 when it does not exist."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
 
 def _completed_indices_from_temp(temp_jsonl_path: Path) -> set[int]:
     """Read the chunk/page indices already written to the live temp JSONL.
@@ -71,21 +99,21 @@ def _completed_indices_from_temp(temp_jsonl_path: Path) -> set[int]:
     so they are naturally excluded and re-attempted on the next pass.
     """
     done: set[int] = set()
-    if not temp_jsonl_path.exists():
-        return done
     try:
-        with temp_jsonl_path.open(encoding="utf-8") as f:
+        with temp_jsonl_path.open("rb", buffering=_TEMP_READ_BUFFER) as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
+                    record = fast_json_loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
                 idx = record.get("chunk_index")
                 if isinstance(idx, int):
                     done.add(idx)
+    except FileNotFoundError:
+        pass
     except OSError as exc:
         logger.warning(f"Could not read temp JSONL {temp_jsonl_path}: {exc}")
     return done
@@ -176,16 +204,20 @@ def _read_temp_records(temp_jsonl_path: Path) -> list[dict[str, Any]]:
     tracking/header lines and malformed lines are skipped.
     """
     results: list[dict[str, Any]] = []
-    if not temp_jsonl_path.exists():
+    # Binary iteration hands each line to orjson as bytes, skipping the
+    # per-line str decode.
+    try:
+        tempf = temp_jsonl_path.open("rb", buffering=_TEMP_READ_BUFFER)
+    except FileNotFoundError:
         return results
-    with temp_jsonl_path.open("r", encoding="utf-8") as tempf:
+    with tempf:
         for raw_line in tempf:
             line = raw_line.strip()
             if not line:
                 continue
             try:
-                record = json.loads(line)
-            except json.JSONDecodeError as e:
+                record = fast_json_loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 logger.warning(f"Failed to parse line in temp file: {e}")
                 continue
             if "custom_id" not in record:
@@ -317,6 +349,17 @@ class FileProcessor:
 
         self.text_processor = TextProcessor()
 
+        # Output directories already created/validated during this run; every
+        # file of a flat-output run shares the same working and temp folders.
+        self._prepared_dirs: set[Path] = set()
+        self._validated_output_roots: set[Path] = set()
+
+        # Stateless messenger and per-schema handlers are identical for every
+        # file of the run, so build them once.
+        self._messenger = _MessagingAdapter()
+        self._schema_handlers: dict[str, Any] = {}
+        self._visual_prompt_template: str | None = None
+
         # Initialize chunking service
         chunking_settings = chunking_config.get("chunking", {})
         self.chunking_service = ChunkingService(
@@ -326,6 +369,25 @@ class FileProcessor:
             ),
             text_processor=self.text_processor,
         )
+        # Chunk count at which a synchronous text run is submitted as a batch
+        # instead; 0 disables the switch.
+        try:
+            self._auto_batch_threshold = max(
+                0, int(chunking_settings.get("auto_batch_threshold") or 0)
+            )
+        except (ValueError, TypeError):
+            logger.warning(
+                "Invalid chunking.auto_batch_threshold %r; auto-batching disabled.",
+                chunking_settings.get("auto_batch_threshold"),
+            )
+            self._auto_batch_threshold = 0
+
+    def _extraction_provider(self) -> str:
+        """Provider of the configured extraction model."""
+        extraction_model = self.model_config.get("extraction_model", {})
+        return extraction_model.get("provider") or detect_provider(
+            extraction_model.get("name", "")
+        )
 
     @staticmethod
     def _is_visual_input(file_path: Path) -> bool:
@@ -388,8 +450,7 @@ class FileProcessor:
                 context_image_enabled=context_image_enabled,
             )
 
-        # Create messaging adapter
-        messenger = _MessagingAdapter()
+        messenger = self._messenger
 
         messenger.info(f"Processing file: {file_path.name}")
         logger.info(f"Starting processing for file: {file_path}")
@@ -397,9 +458,12 @@ class FileProcessor:
         # Read and normalize text
         # OpenAI API requires UTF-8, so try UTF-8 first, then fallback to detection
         try:
+            # One bulk read, off the event loop so concurrently processed
+            # files keep their LLM calls moving; the UTF-8 attempt and the
+            # fallback both decode this buffer.
+            data = await asyncio.to_thread(file_path.read_bytes)
             try:
-                with file_path.open("r", encoding="utf-8") as f:
-                    lines = f.readlines()
+                text = data.decode("utf-8")
                 logger.info(
                     f"Successfully read file {file_path.name} using UTF-8 encoding"
                 )
@@ -412,18 +476,17 @@ class FileProcessor:
                 logger.warning(
                     f"UTF-8 decode failed for {file_path.name}, using chardet detection"
                 )
-                encoding = TextProcessor.detect_encoding(file_path)
+                encoding = TextProcessor.detect_encoding_bytes(data)
                 messenger.info(f"Detected encoding: {encoding}")
-                with file_path.open("r", encoding=encoding) as f:
-                    lines = f.readlines()
+                text = data.decode(encoding)
 
             # Strip only the trailing line terminator, preserving indentation
             # and interior whitespace. split_text_into_chunks re-joins these
             # lines with "\n"; stripping both sides (the old normalize_text)
             # and joining with "" merged words across line boundaries.
-            normalized_lines = [line.rstrip("\n\r") for line in lines]
+            normalized_lines = TextProcessor.split_lines(text)
             messenger.info(
-                f"Successfully read and normalized {len(lines)} lines"
+                f"Successfully read and normalized {len(normalized_lines)} lines"
                 f" from {file_path.name}"
             )
         except Exception as e:
@@ -535,7 +598,7 @@ class FileProcessor:
             resolve_target_dpi,
         )
 
-        messenger = _MessagingAdapter()
+        messenger = self._messenger
         messenger.info(f"Processing visual file: {file_path.name}")
         logger.info(f"Starting visual processing for file: {file_path}")
 
@@ -668,13 +731,18 @@ class FileProcessor:
             )
             return "skipped"
 
-        # Load visual extraction prompt
-        visual_prompt_path = PROMPTS_DIR / "image_extraction_prompt.txt"
-        try:
-            visual_prompt_template = load_prompt_template(visual_prompt_path)
-        except FileNotFoundError:
-            messenger.error(f"Visual extraction prompt not found: {visual_prompt_path}")
-            return "failed"
+        # Load visual extraction prompt (once per processor)
+        visual_prompt_template = self._visual_prompt_template
+        if visual_prompt_template is None:
+            visual_prompt_path = PROMPTS_DIR / "image_extraction_prompt.txt"
+            try:
+                visual_prompt_template = load_prompt_template(visual_prompt_path)
+            except FileNotFoundError:
+                messenger.error(
+                    f"Visual extraction prompt not found: {visual_prompt_path}"
+                )
+                return "failed"
+            self._visual_prompt_template = visual_prompt_template
 
         # 6. File-level provenance (source hash + preprocessing params)
         file_provenance = await asyncio.to_thread(
@@ -877,7 +945,10 @@ class FileProcessor:
 
         # Get schema handler
         try:
-            handler = get_schema_handler(schema_name)
+            handler = self._schema_handlers.get(schema_name)
+            if handler is None:
+                handler = get_schema_handler(schema_name)
+                self._schema_handlers[schema_name] = handler
         except Exception as e:
             messenger.error(f"Failed to get schema handler: {e}", exc_info=e)
             return "failed"
@@ -979,6 +1050,43 @@ class FileProcessor:
                     f" {unit_label}s already done"
                 )
 
+        auto_batched = False
+        # Large text files may be routed to the provider's batch API (half the
+        # per-token price) when chunking.auto_batch_threshold is set. Decided
+        # after resume detection, so the sync consistency guard and the
+        # fully-processed skip above still apply and only the chunks still
+        # pending count toward the threshold. Only a text run without a live
+        # sync temp JSONL switches: batch submission would rewrite it, and the
+        # visual sync path streams pages.
+        if (
+            not use_batch
+            and self._auto_batch_threshold
+            and image_chunks is None
+            and source_factory is None
+        ):
+            pending_count = sum(
+                1
+                for i in (
+                    chunk_indices
+                    if chunk_indices is not None
+                    else range(1, len(chunks) + 1)
+                )
+                if i not in completed_chunk_indices
+            )
+            if (
+                pending_count >= self._auto_batch_threshold
+                and _file_size(temp_jsonl_path) == 0
+                and supports_batch(self._extraction_provider())
+            ):
+                use_batch = True
+                auto_batched = True
+                messenger.info(
+                    f"{file_path.name}: {pending_count} pending {unit_label}s "
+                    f"reach the auto-batch threshold "
+                    f"({self._auto_batch_threshold}); submitting as a batch. "
+                    "Run 'python main/check_batches.py' to collect results."
+                )
+
         # A hard-crashed sync run can leave records only in the temp JSONL
         # (never merged into an output). Batch submission rewrites the temp in
         # "w" mode, so those records would be silently destroyed and re-billed.
@@ -1183,7 +1291,7 @@ class FileProcessor:
             wrote_output = False
             if not use_batch:
                 try:
-                    if temp_jsonl_path.exists() and temp_jsonl_path.stat().st_size > 0:
+                    if _file_size(temp_jsonl_path) > 0:
                         # Build chunk slice metadata if a slice was applied
                         _cs_info: dict | None = None
                         if chunk_slice is not None and (
@@ -1256,12 +1364,21 @@ class FileProcessor:
                         f"Partial completion of file: {file_path.name} "
                         f"({reason}); re-run in resume mode to finish."
                     )
+                elif auto_batched:
+                    # Only submitted: the output JSON appears once
+                    # check_batches collects the results.
+                    messenger.info(
+                        f"Batch submitted for file: {file_path.name}; run "
+                        "'python main/check_batches.py' to collect results."
+                    )
                 else:
                     messenger.success(f"Completed processing of file: {file_path.name}")
 
         # Machine-readable per-file status for exit-code aggregation.
         if processing_exception is not None:
             return "failed"
+        if auto_batched:
+            return "submitted"
         if budget_incomplete or failed_indices:
             return "partial"
         return "complete"
@@ -1293,16 +1410,17 @@ class FileProcessor:
     def _setup_output_paths(
         self, file_path: Path, schema_paths: dict[str, Any]
     ) -> tuple[Path, Path, Path]:
-        """Set up output directory paths."""
+        """Set up output directory paths.
+
+        Only the directories go through ``ensure_path_safe``; file names and
+        the fixed ``temp_jsonl`` folder are joined onto an already-normalized
+        directory, so resolving them again would only repeat the stat calls.
+        """
         if self.paths_config["general"]["input_paths_is_output_path"]:
             working_folder = ensure_path_safe(file_path.parent)
-            output_json_path = ensure_path_safe(
-                working_folder / f"{file_path.stem}_output.json"
-            )
-            temp_jsonl_path = ensure_path_safe(
-                working_folder / f"{file_path.stem}_temp.jsonl"
-            )
-            working_folder.mkdir(parents=True, exist_ok=True)
+            output_json_path = working_folder / f"{file_path.stem}_output.json"
+            temp_jsonl_path = working_folder / f"{file_path.stem}_temp.jsonl"
+            self._ensure_dir(working_folder)
         else:
             output_path_str = schema_paths.get("output", "")
             # CM-7: Validate that output path is not empty or CWD
@@ -1313,38 +1431,38 @@ class FileProcessor:
                     "'input_paths_is_output_path: true' in general settings."
                 )
             working_folder = ensure_path_safe(Path(output_path_str))
-            if working_folder.resolve() == Path.cwd().resolve():
-                raise ValueError(
-                    f"Output path '{working_folder}' resolves to the current working "
-                    "directory. Configure a specific output directory to avoid mixing "
-                    "output with project files."
-                )
+            if working_folder not in self._validated_output_roots:
+                if working_folder.resolve() == Path.cwd().resolve():
+                    raise ValueError(
+                        f"Output path '{working_folder}' resolves to the current "
+                        "working directory. Configure a specific output directory "
+                        "to avoid mixing output with project files."
+                    )
+                self._validated_output_roots.add(working_folder)
             if self.output_mode == "mirror" and self.input_root is not None:
                 rel_dir = mirrored_output_subdir(file_path, self.input_root)
                 mirror_dir = ensure_path_safe(working_folder / rel_dir)
-                mirror_dir.mkdir(parents=True, exist_ok=True)
-                temp_folder = ensure_path_safe(mirror_dir / "temp_jsonl")
-                temp_folder.mkdir(parents=True, exist_ok=True)
-                output_json_path = ensure_path_safe(
-                    mirror_dir / f"{file_path.stem}_output.json"
-                )
-                temp_jsonl_path = ensure_path_safe(
-                    temp_folder / f"{file_path.stem}_temp.jsonl"
-                )
+                self._ensure_dir(mirror_dir)
+                temp_folder = mirror_dir / "temp_jsonl"
+                self._ensure_dir(temp_folder)
+                output_json_path = mirror_dir / f"{file_path.stem}_output.json"
+                temp_jsonl_path = temp_folder / f"{file_path.stem}_temp.jsonl"
                 return mirror_dir, output_json_path, temp_jsonl_path
 
-            temp_folder = ensure_path_safe(working_folder / "temp_jsonl")
-            working_folder.mkdir(parents=True, exist_ok=True)
-            temp_folder.mkdir(parents=True, exist_ok=True)
-            output_json_path = ensure_path_safe(
-                working_folder / f"{file_path.stem}_output.json"
-            )
-            temp_jsonl_path = ensure_path_safe(
-                temp_folder / f"{file_path.stem}_temp.jsonl"
-            )
+            temp_folder = working_folder / "temp_jsonl"
+            self._ensure_dir(working_folder)
+            self._ensure_dir(temp_folder)
+            output_json_path = working_folder / f"{file_path.stem}_output.json"
+            temp_jsonl_path = temp_folder / f"{file_path.stem}_temp.jsonl"
 
         return working_folder, output_json_path, temp_jsonl_path
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create *path* (with parents) once per processor instance."""
+        if path not in self._prepared_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._prepared_dirs.add(path)
+
     async def _generate_output_files(
         self,
         temp_jsonl_path: Path,
@@ -1451,7 +1569,7 @@ class FileProcessor:
             return False
 
         # Generate additional formats
-        self._generate_additional_formats(
+        await self._generate_additional_formats(
             output_json_path, handler, schema_paths, messenger
         )
         return True
@@ -1478,9 +1596,8 @@ class FileProcessor:
             return new_results
 
         try:
-            with output_json_path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-        except (json.JSONDecodeError, OSError) as exc:
+            data = fast_json_loads(output_json_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
             messenger.warning(
                 f"Could not read existing output for resume merge "
                 f"({output_json_path.name}): {exc}. Keeping new records only."
@@ -1517,37 +1634,65 @@ class FileProcessor:
 
         return list(merged.values()) + extras
 
-    def _generate_additional_formats(
+    async def _generate_additional_formats(
         self,
         output_json_path: Path,
         handler: Any,
         schema_paths: dict[str, Any],
         messenger: _MessagingAdapter,
     ) -> None:
-        """Generate CSV, DOCX, and TXT outputs if configured."""
-        if schema_paths.get("csv_output", False):
-            try:
-                output_csv_path = output_json_path.with_suffix(".csv")
-                handler.convert_to_csv(output_json_path, output_csv_path)
-                messenger.info(f"CSV output saved to {output_csv_path}")
-            except Exception as e:
-                messenger.warning(f"Failed to generate CSV output: {e}")
+        """Generate CSV, DOCX, and TXT outputs if configured.
 
-        if schema_paths.get("docx_output", False):
-            try:
-                output_docx_path = output_json_path.with_suffix(".docx")
-                handler.convert_to_docx(output_json_path, output_docx_path)
-                messenger.info(f"DOCX output saved to {output_docx_path}")
-            except Exception as e:
-                messenger.warning(f"Failed to generate DOCX output: {e}")
+        The converters are independent and blocking, so the enabled ones run
+        concurrently in worker threads; each failure is reported on its own.
+        The output's entries are extracted once and handed to every converter
+        that takes an ``entries`` argument.
+        """
+        conversions = [
+            (label, suffix, method)
+            for key, label, suffix, method in (
+                ("csv_output", "CSV", ".csv", "convert_to_csv"),
+                ("docx_output", "DOCX", ".docx", "convert_to_docx"),
+                ("txt_output", "TXT", ".txt", "convert_to_txt"),
+            )
+            if schema_paths.get(key, False)
+        ]
+        if not conversions:
+            return
+
+        entries = (
+            await asyncio.to_thread(extract_entries_from_json, output_json_path)
+            if any(
+                _accepts_entries(getattr(handler, method, None))
+                for _label, _suffix, method in conversions
+            )
+            else None
+        )
 
-        if schema_paths.get("txt_output", False):
-            try:
-                output_txt_path = output_json_path.with_suffix(".txt")
-                handler.convert_to_txt(output_json_path, output_txt_path)
-                messenger.info(f"TXT output saved to {output_txt_path}")
-            except Exception as e:
-                messenger.warning(f"Failed to generate TXT output: {e}")
+        def convert(method: str, output_path: Path) -> None:
+            # Resolved in the worker so a handler lacking one converter fails
+            # only that format.
+            converter = getattr(handler, method)
+            if entries is not None and _accepts_entries(converter):
+                converter(output_json_path, output_path, entries=entries)
+            else:
+                converter(output_json_path, output_path)
+
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.to_thread(convert, method, output_json_path.with_suffix(suffix))
+                for _label, suffix, method in conversions
+            ),
+            return_exceptions=True,
+        )
+        for (label, suffix, _method), outcome in zip(
+            conversions, outcomes, strict=True
+        ):
+            if isinstance(outcome, BaseException):
+                messenger.warning(f"Failed to generate {label} output: {outcome}")
+            else:
+                output_path = output_json_path.with_suffix(suffix)
+                messenger.info(f"{label} output saved to {output_path}")
 
     def _cleanup_temp_files(
         self,
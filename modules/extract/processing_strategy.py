@@ -16,6 +16,7 @@ OpenRouter does not support batch processing.
 
 import asyncio
 import contextlib
+import copy
 import hashlib
 import json
 import logging
@@ -38,8 +39,12 @@ from modules.conversion.json_utils import strip_image_payloads
 from modules.extract.resume import build_temp_header
 from modules.images.page_stream import PageError
 from modules.infra.chunking import TextProcessor
-from modules.infra.jsonl import atomic_write_json
-from modules.infra.rate_limit import await_capacity, get_shared_rate_limiter
+from modules.infra.jsonl import atomic_write_json, fast_json_loads
+from modules.infra.rate_limit import (
+    await_capacity,
+    estimate_request_tokens,
+    get_shared_rate_limiter,
+)
 from modules.infra.token_tracker import get_token_tracker
 from modules.llm.langchain_provider import ProviderConfig
 from modules.llm.openai_utils import (
@@ -153,14 +158,14 @@ def _harvest_batch_tracking(temp_jsonl_path: Path) -> dict[str, Any]:
         if not candidate.exists():
             continue
         try:
-            with candidate.open(encoding="utf-8") as fh:
+            with candidate.open("rb") as fh:
                 for line in fh:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError:
+                        record = fast_json_loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         continue
                     if not isinstance(record, dict):
                         continue
@@ -371,6 +376,74 @@ def commit_tokens_from_exception(
         logger.debug("Token recovery from exception failed", exc_info=True)
 
 
+# Process-wide cache of text-chunk responses, enabled by
+# concurrency.extraction.response_cache. Keyed by a digest of everything that
+# shapes the request, so identical boilerplate chunks (recurring headers,
+# tables, front matter) across files are answered without a second API call.
+# Opt-in and in-memory only: the key covers the rendered system prompt (with
+# its per-file context), schema, model and sampling settings, which a key on
+# the chunk text alone could not. Cleared when full rather than evicted entry
+# by entry.
+_RESPONSE_CACHE: dict[str, dict[str, Any]] = {}
+_RESPONSE_CACHE_MAX = 256
+
+
+# Extractor attributes that change what the model returns for the same input;
+# part of every response-cache key so a later run in the same process with
+# different sampling or reasoning settings never sees stale answers.
+_RESPONSE_CACHE_SETTINGS = (
+    "provider",
+    "model",
+    "max_output_tokens",
+    "temperature",
+    "top_p",
+    "presence_penalty",
+    "frequency_penalty",
+    "reasoning",
+    "text_params",
+)
+
+
+def _response_cache_scope(extractor: Any, schema: dict[str, Any]) -> str:
+    """Serialize the request settings shared by every chunk of one run."""
+    settings = {
+        name: getattr(extractor, name, None) for name in _RESPONSE_CACHE_SETTINGS
+    }
+    return json.dumps(
+        {"settings": settings, "schema": schema}, sort_keys=True, default=str
+    )
+
+
+def _response_cache_key(scope: str, dev_message: str, chunk: str) -> str:
+    """Digest identifying one text-chunk request for the response cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (scope, dev_message, chunk):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _remember_response(key: str, result: dict[str, Any]) -> None:
+    """Store a private copy of a successful text-chunk *result* under *key*."""
+    if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+        _RESPONSE_CACHE.clear()
+    _RESPONSE_CACHE[key] = copy.deepcopy(result)
+
+
+def _replay_response(cached: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a cached *result* with its token usage zeroed.
+
+    The tokens were billed once, by the call that produced the response;
+    replaying its usage would count them again in any downstream tally.
+    """
+    result = copy.deepcopy(cached)
+    result["usage"] = {}
+    response_data = result.get("response_data")
+    if isinstance(response_data, dict):
+        response_data.pop("usage", None)
+    return result
+
+
 def _append_jsonl_line(handle: Any, line: str) -> None:
     """Write and flush one line to *handle* (run off-loop via to_thread)."""
     handle.write(line)
@@ -539,6 +612,14 @@ class SynchronousProcessingStrategy(ProcessingStrategy):
         wait_max_seconds = float(retry_cfg.get("wait_max_seconds", 120.0) or 120.0)
         jitter_max_seconds = float(retry_cfg.get("jitter_max_seconds", 0.0) or 0.0)
 
+        # Identical text chunks are answered from the process-wide response
+        # cache when enabled; image pages and context-image runs always call
+        # the API.
+        use_response_cache = (
+            bool(extraction_cfg.get("response_cache", False))
+            and context_image_data is None
+        )
+
         # Per-provider shared rate limiter: throttles synchronous calls under
         # the configured windows BEFORE each API call (permissive defaults when
         # unconfigured). Batch submission never passes through here.
@@ -574,6 +655,11 @@ class SynchronousProcessingStrategy(ProcessingStrategy):
             model_config_override=model_config,
             concurrency_config_override=self.concurrency_config,
         ) as extractor:
+            cache_scope = (
+                _response_cache_scope(extractor, schema) if use_response_cache else ""
+            )
+            # The system prompt is sent with every unit; estimate it once.
+            dev_message_tokens = estimate_request_tokens(dev_message, 0)
             with temp_jsonl_path.open(file_mode, encoding="utf-8") as tempf:
                 if file_mode == "w":
                     tempf.write(json.dumps(build_temp_header()) + "\n")
@@ -596,13 +682,33 @@ class SynchronousProcessingStrategy(ProcessingStrategy):
                 ) -> dict[str, Any]:
                     """Run one unit through the retry loop and persist it."""
                     nonlocal units_done
+                    cache_key: str | None = None
+                    cached: dict[str, Any] | None = None
+                    if use_response_cache and img_data is None:
+                        cache_key = _response_cache_key(cache_scope, dev_message, chunk)
+                        cached = _RESPONSE_CACHE.get(cache_key)
+                    # Charged against the token windows, when configured;
+                    # image input size is unknown up front, so only the
+                    # system prompt and output ceiling count for pages.
+                    est_tokens = (
+                        dev_message_tokens
+                        + estimate_request_tokens(
+                            "" if img_data is not None else chunk,
+                            extractor.max_output_tokens,
+                        )
+                        if rate_limiter.token_limits
+                        else 0
+                    )
                     for attempt in range(retry_attempts):
                         # Acquire rate-limit capacity off the event loop before
                         # each API call so bursts stay under the provider caps.
-                        await await_capacity(rate_limiter)
+                        if cached is None:
+                            await await_capacity(rate_limiter, tokens=est_tokens)
                         try:
                             # Route to image or text processing
-                            if img_data is not None:
+                            if cached is not None:
+                                result = _replay_response(cached)
+                            elif img_data is not None:
                                 result = await process_image_chunk(
                                     image_base64=img_data["base64"],
                                     mime_type=img_data["mime_type"],
@@ -658,6 +764,9 @@ class SynchronousProcessingStrategy(ProcessingStrategy):
                                     "chunk_index": idx,
                                 }
 
+                            if cache_key is not None and cached is None:
+                                _remember_response(cache_key, result)
+
                             # chunk_index drives ordering in
                             # _generate_output_files; without it the final
                             # records sort by `None or 0` (all equal) and
@@ -675,6 +784,10 @@ class SynchronousProcessingStrategy(ProcessingStrategy):
                             }
                             if chunk_range is not None:
                                 response_obj["chunk_range"] = list(chunk_range)
+                            if cached is not None:
+                                # Served from the response cache: no API call,
+                                # no tokens billed for this record.
+                                response_obj["cached"] = True
                             provenance = (img_data or {}).get("image_provenance")
                             if provenance:
                                 response_obj["image_provenance"] = provenance
@@ -686,7 +799,8 @@ class SynchronousProcessingStrategy(ProcessingStrategy):
                             async with write_lock:
                                 await asyncio.to_thread(_append_jsonl_line, tempf, line)
 
-                            rate_limiter.report_success()
+                            if cached is None:
+                                rate_limiter.report_success()
                             units_done += 1
                             # Counter over units processed THIS run; keep the
                             # absolute document index visible. A prior version
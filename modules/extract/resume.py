@@ -21,6 +21,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from modules.infra.jsonl import fast_json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -161,14 +163,23 @@ def build_extraction_metadata(
     return meta
 
 
-def read_extraction_metadata(output_json: Path) -> dict[str, Any] | None:
-    """Read embedded metadata from an extraction output JSON, if present."""
+def _load_output_json(output_json: Path) -> Any | None:
+    """Parse an extraction output JSON, or return ``None`` if unreadable.
+
+    Outputs can run to many megabytes on large resumed files; the raw bytes
+    go straight to orjson (via ``fast_json_loads``) instead of through the
+    stdlib parser.
+    """
     try:
-        with output_json.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
+        return fast_json_loads(output_json.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return None
 
+
+def read_extraction_metadata(output_json: Path) -> dict[str, Any] | None:
+    """Read embedded metadata from an extraction output JSON, if present."""
+    data = _load_output_json(output_json)
+
     if isinstance(data, dict):
         return data.get(_METADATA_KEY)
     return None
@@ -191,10 +202,8 @@ def detect_extraction_status(
     if not output_json.exists():
         return FileStatus.NOT_STARTED, set()
 
-    try:
-        with output_json.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
+    data = _load_output_json(output_json)
+    if data is None:
         logger.warning("Could not parse %s; treating as NOT_STARTED", output_json)
         return FileStatus.NOT_STARTED, set()
 
@@ -242,10 +251,7 @@ def completed_indices_from_outputs(*output_paths: Path) -> set[int]:
     for path in output_paths:
         if not path.exists():
             continue
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            continue
+        data = _load_output_json(path)
         if isinstance(data, dict):
             items = data.get("records") or data.get("responses") or []
         elif isinstance(data, list):
@@ -2,6 +2,7 @@
 
 import logging
 from pathlib import Path
+from typing import Any
 
 from modules.conversion.csv_converter import CSVConverter
 from modules.conversion.document_converter import DocumentConverter
@@ -15,20 +16,26 @@ class BaseSchemaHandler:
     def __init__(self, schema_name: str) -> None:
         self.schema_name = schema_name
 
-    def convert_to_csv(self, json_file: Path, output_csv: Path) -> None:
+    def convert_to_csv(
+        self, json_file: Path, output_csv: Path, entries: list[Any] | None = None
+    ) -> None:
         """Convert JSON to CSV format."""
         csv_converter = CSVConverter(self.schema_name)
-        csv_converter.convert_to_csv(json_file, output_csv)
+        csv_converter.convert_to_csv(json_file, output_csv, entries=entries)
 
-    def convert_to_docx(self, json_file: Path, output_docx: Path) -> None:
+    def convert_to_docx(
+        self, json_file: Path, output_docx: Path, entries: list[Any] | None = None
+    ) -> None:
         """Convert JSON to DOCX format."""
         doc_converter = DocumentConverter(self.schema_name)
-        doc_converter.convert_to_docx(json_file, output_docx)
+        doc_converter.convert_to_docx(json_file, output_docx, entries=entries)
 
-    def convert_to_txt(self, json_file: Path, output_txt: Path) -> None:
+    def convert_to_txt(
+        self, json_file: Path, output_txt: Path, entries: list[Any] | None = None
+    ) -> None:
         """Convert JSON to TXT format."""
         doc_converter = DocumentConverter(self.schema_name)
-        doc_converter.convert_to_txt(json_file, output_txt)
+        doc_converter.convert_to_txt(json_file, output_txt, entries=entries)
 
 
 # Registry for schema handlers
@@ -43,7 +50,10 @@ def register_schema_handler(schema_name: str, handler_class: type) -> None:
 def get_schema_handler(schema_name: str) -> BaseSchemaHandler:
     """Get the handler for a schema, defaulting to BaseSchemaHandler if not
     registered."""
-    return schema_handlers_registry.get(schema_name, BaseSchemaHandler(schema_name))
+    handler = schema_handlers_registry.get(schema_name)
+    if handler is None:
+        handler = BaseSchemaHandler(schema_name)
+    return handler
 
 
 # Register existing schema handlers with the default implementation.
@@ -22,6 +22,8 @@ from modules.infra.jsonl import (
     compute_ranges_fingerprint,
     compute_stats_from_jsonl,
     extract_completed_ids,
+    fast_json_dumps,
+    fast_json_loads,
     finalize_jsonl_header,
     is_jsonl_adjustment_complete,
     read_jsonl_header,
@@ -39,8 +41,10 @@ from modules.infra.paths import (
 from modules.infra.rate_limit import (
     RateLimiter,
     await_capacity,
+    estimate_request_tokens,
     get_rate_limits,
     get_shared_rate_limiter,
+    get_token_rate_limits,
     reset_shared_rate_limiters,
 )
 from modules.infra.token_tracker import (
@@ -63,9 +67,11 @@ __all__ = [
     "check_and_wait_for_token_limit",
     "RateLimiter",
     "get_rate_limits",
+    "get_token_rate_limits",
     "get_shared_rate_limiter",
     "reset_shared_rate_limiters",
     "await_capacity",
+    "estimate_request_tokens",
     "TextProcessor",
     "ChunkingStrategy",
     "TokenBasedChunking",
@@ -77,6 +83,8 @@ __all__ = [
     "JsonlWriter",
     "read_jsonl_records",
     "extract_completed_ids",
+    "fast_json_dumps",
+    "fast_json_loads",
     "build_jsonl_header",
     "compute_ranges_fingerprint",
     "compute_stats_from_jsonl",
@@ -12,6 +12,7 @@ Public surface:
 
 from __future__ import annotations
 
+import codecs
 import functools
 import logging
 import re
@@ -74,6 +75,16 @@ def _special_token_pattern(encoding_name: str) -> re.Pattern[str] | None:
 # ---------------------------------------------------------------------------
 
 
+# UTF-32 first: the UTF-32-LE mark begins with the UTF-16-LE one. The codecs
+# named here consume the mark while decoding.
+_UTF16_32_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
 class TextProcessor:
     """
     Handles tasks such as encoding detection, text normalization, and token
@@ -91,11 +102,46 @@ class TextProcessor:
         safe_path = ensure_path_safe(file_path)
         with safe_path.open("rb") as f:
             raw_data = f.read(100000)
-        result = _charset_detect(raw_data)
+        return TextProcessor.detect_encoding_bytes(raw_data)
+
+    @staticmethod
+    def detect_encoding_bytes(data: bytes) -> str:
+        """
+        Detect the encoding of already-loaded file contents.
+
+        A UTF-16/UTF-32 byte-order mark settles the encoding outright;
+        otherwise only the first 100000 bytes are examined, matching
+        :meth:`detect_encoding`.
+
+        :param data: Raw file contents.
+        :return: The detected encoding.
+        """
+        for bom, encoding in _UTF16_32_BOMS:
+            if data.startswith(bom):
+                logger.info(f"Detected file encoding from BOM: {encoding}")
+                return encoding
+        result = _charset_detect(data[:100000])
         encoding = result["encoding"]
         logger.info(f"Detected file encoding: {encoding}")
         return encoding or "utf-8"
 
+    @staticmethod
+    def split_lines(text: str) -> list[str]:
+        """
+        Split decoded text into lines without their terminators.
+
+        Matches iterating a text-mode file and stripping each line's
+        terminator: ``\n``, ``\r\n`` and ``\r`` end a line, other Unicode
+        separators (form feeds, ``\u2028``) stay in the text, and a final
+        terminator does not produce an empty trailing line.
+        """
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        lines = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return lines
+
     @staticmethod
     def normalize_text(text: str) -> str:
         """
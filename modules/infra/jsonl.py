@@ -21,9 +21,48 @@ from typing import IO, Any
 
 from modules.infra.paths import ensure_path_safe
 
+# orjson is an optional accelerator (installed transitively via langsmith);
+# every helper below falls back to the stdlib ``json`` module without it.
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def fast_json_loads(data: str | bytes) -> Any:
+    """Parse JSON text, preferring orjson.
+
+    Input orjson rejects but the stdlib accepts (``NaN``/``Infinity``
+    literals) is re-parsed with ``json.loads``; malformed input raises
+    ``json.JSONDecodeError`` either way. Under orjson, integers beyond 64 bits
+    parse as floats.
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def fast_json_dumps(obj: Any) -> str:
+    """Serialize to compact, non-ASCII-escaped JSON text, preferring orjson.
+
+    Objects orjson rejects (non-string keys, integers beyond 64 bits) fall
+    back to ``json.dumps`` with the same compact separators.
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 class JsonlWriter:
     """Context manager for writing JSONL records with auto-flush.
 
@@ -333,15 +372,18 @@ def atomic_write_json(path: Path, data: Any) -> None:
     onto the destination so a crash mid-write cannot truncate or destroy a
     previously written file. Mirrors ``update_jsonl_header``'s temp-then-
     replace pattern.
+
+    ``json.dump`` streams the encoder's fragments through a 1 MiB write
+    buffer, so the full document is never held in memory as one string next
+    to the records it serializes.
     """
     safe_path = ensure_path_safe(path)
     tmp_path = safe_path.with_name(
         f"{safe_path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
     )
     try:
-        tmp_path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        with tmp_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+            json.dump(data, fh, indent=2, ensure_ascii=False)
         tmp_path.replace(safe_path)
     finally:
         with contextlib.suppress(OSError):
@@ -14,6 +14,7 @@ use plain ``logging.getLogger(__name__)`` (e.g. ``modules.config.context``,
 ``setup_logger`` users, while guaranteeing each record is emitted once.
 """
 
+import functools
 import logging
 from pathlib import Path
 
@@ -43,6 +44,18 @@ def _resolve_logs_dir() -> Path:
     return PROJECT_ROOT / "logs"
 
 
+@functools.lru_cache(maxsize=1)
+def _log_file() -> Path:
+    """Resolve (and create the directory of) the shared log file once.
+
+    ``setup_logger`` runs at import time in most modules; caching keeps that
+    to a dict lookup instead of a config read, path checks and a mkdir each.
+    """
+    logs_dir = ensure_path_safe(_resolve_logs_dir())
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    return ensure_path_safe(logs_dir / "application.log")
+
+
 def _configure_base_logger(base: logging.Logger, log_file: Path) -> None:
     """Attach the shared file + console handlers to a top-level logger once."""
     base.setLevel(logging.INFO)
@@ -70,9 +83,7 @@ def setup_logger(name: str) -> logging.Logger:
     exactly once.
     """
 
-    logs_dir = ensure_path_safe(_resolve_logs_dir())
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    log_file = ensure_path_safe(logs_dir / "application.log")
+    log_file = _log_file()
 
     # Always configure the shared package namespaces so plain
     # logging.getLogger(__name__) loggers under modules/ and main/ are
@@ -4,7 +4,9 @@ A multi-window sliding-log limiter: it tracks request timestamps across several
 concurrent windows (e.g. per-second, per-minute, per-hour) and blocks until all
 windows have capacity before admitting the next call. An adaptive error
 multiplier lengthens waits after rate-limit / server errors and relaxes again on
-success, smoothing bursts that would otherwise trip provider 429s.
+success, smoothing bursts that would otherwise trip provider 429s. Optional
+token windows apply the same sliding-log budget to estimated tokens, so large
+requests are held back before they would trip a tokens-per-minute cap.
 
 The limiter is synchronous and thread-safe (it is shared across the asyncio
 fan-out, which dispatches synchronous LLM calls onto worker threads). Use
@@ -14,7 +16,7 @@ event loop.
 Usage::
 
     limiter = get_shared_rate_limiter("openai")
-    await await_capacity(limiter)      # blocks off-loop until capacity
+    await await_capacity(limiter, tokens=estimate_request_tokens(text, 4096))
     try:
         ...                            # make the API call
         limiter.report_success()
@@ -55,6 +57,13 @@ ERROR_BASE_PENALTY_SECONDS = 0.5
 # Permissive defaults applied when no rate_limits block is configured. Chosen so
 # the limiter is effectively transparent for typical workloads.
 DEFAULT_RATE_LIMITS: list[tuple[int, int]] = [(120, 1), (15000, 60), (15000, 3600)]
+# Rough characters-per-token ratio used to estimate prompt size up front.
+CHARS_PER_TOKEN_ESTIMATE = 4
+
+
+def estimate_request_tokens(text: str, max_output_tokens: int) -> int:
+    """Estimate a request's token cost: prompt size plus the output ceiling."""
+    return len(text) // CHARS_PER_TOKEN_ESTIMATE + max(0, int(max_output_tokens))
 
 
 class RateLimiter:
@@ -66,6 +75,9 @@ class RateLimiter:
 
     limits: list[tuple[int, int]]
     request_timestamps: list[deque[float]]
+    token_limits: list[tuple[int, int]]
+    token_logs: list[deque[tuple[float, int]]]
+    token_totals: list[int]
     lock: threading.Lock
     total_requests: int
     total_wait_time: float
@@ -75,13 +87,23 @@ class RateLimiter:
     error_multiplier: float
     max_error_multiplier: float
 
-    def __init__(self, limits: list[tuple[int, int]]) -> None:
+    def __init__(
+        self,
+        limits: list[tuple[int, int]],
+        token_limits: list[tuple[int, int]] | None = None,
+    ) -> None:
         """Initialize the limiter.
 
         :param limits: List of ``(max_requests, window_seconds)`` tuples.
+        :param token_limits: Optional list of ``(max_tokens, window_seconds)``
+            tuples, enforced against the ``tokens`` passed to
+            :meth:`wait_for_capacity`.
         """
         self.limits = list(limits)
         self.request_timestamps = [deque(maxlen=limit[0]) for limit in self.limits]
+        self.token_limits = list(token_limits or [])
+        self.token_logs = [deque() for _ in self.token_limits]
+        self.token_totals = [0 for _ in self.token_limits]
         self.lock = threading.Lock()
 
         # Statistics.
@@ -95,9 +117,37 @@ class RateLimiter:
         self.error_multiplier = 1.0
         self.max_error_multiplier = MAX_ERROR_MULTIPLIER
 
-    def wait_for_capacity(self) -> float:
+    def _token_wait(self, now: float, tokens: int) -> float:
+        """Seconds until every token window can absorb *tokens* (lock held).
+
+        Expired entries are evicted first. A request larger than a window's
+        whole budget waits only for that window to drain, never forever.
+        """
+        wait_time = 0.0
+        for i, (max_tokens, seconds) in enumerate(self.token_limits):
+            log = self.token_logs[i]
+            cutoff = now - seconds
+            while log and log[0][0] < cutoff:
+                self.token_totals[i] -= log.popleft()[1]
+
+            excess = self.token_totals[i] + tokens - max_tokens
+            if excess <= 0 or not log:
+                continue
+            freed = 0
+            release_at = log[-1][0]
+            for timestamp, used in log:
+                freed += used
+                if freed >= excess:
+                    release_at = timestamp
+                    break
+            wait_time = max(wait_time, release_at + seconds - now)
+        return wait_time
+
+    def wait_for_capacity(self, tokens: int = 0) -> float:
         """Block until every window has capacity, then record the request.
 
+        :param tokens: Estimated token cost of the request, charged against
+            the token windows (ignored when none are configured).
         :return: Total time waited, in seconds.
         """
         wait_start = time.monotonic()
@@ -121,6 +171,9 @@ class RateLimiter:
                         required_wait = oldest_request_time + seconds - now
                         wait_time = max(wait_time, required_wait)
 
+                if tokens > 0 and self.token_limits:
+                    wait_time = max(wait_time, self._token_wait(now, tokens))
+
                 # Lengthen the wait when recent errors have raised the
                 # multiplier. Multiplying a saturated window's wait spreads
                 # bursts out; when no window imposes a wait, delay admission by
@@ -140,6 +193,10 @@ class RateLimiter:
                 if wait_time <= 0:
                     for timestamps in self.request_timestamps:
                         timestamps.append(now)
+                    if tokens > 0:
+                        for i, log in enumerate(self.token_logs):
+                            log.append((now, tokens))
+                            self.token_totals[i] += tokens
                     self.total_requests += 1
                     self.request_count_since_last_update += 1
                     total_wait = time.monotonic() - wait_start
@@ -201,6 +258,7 @@ class RateLimiter:
                 ),
                 "current_rate": round(requests_per_second, 2),
                 "current_queue_lengths": [len(ts) for ts in self.request_timestamps],
+                "current_token_usage": list(self.token_totals),
                 "error_multiplier": round(self.error_multiplier, 2),
             }
 
@@ -210,6 +268,39 @@ class RateLimiter:
             return stats
 
 
+def _parse_windows(raw_limits: list[Any], key: str) -> list[tuple[int, int]]:
+    """Parse ``[max_count, window_seconds]`` pairs, skipping invalid entries."""
+    limits: list[tuple[int, int]] = []
+    for item in raw_limits:
+        if not (isinstance(item, list | tuple) and len(item) == 2):
+            logger.warning("Skipping malformed %s entry: %r", key, item)
+            continue
+        try:
+            max_count, window_seconds = int(item[0]), int(item[1])
+        except (ValueError, TypeError):
+            logger.warning("Skipping non-integer %s entry: %r", key, item)
+            continue
+        if max_count < 1 or window_seconds <= 0:
+            logger.warning(
+                "Skipping non-positive %s entry (the limit must be >= 1 and "
+                "window_seconds > 0): %r",
+                key,
+                item,
+            )
+            continue
+        limits.append((max_count, window_seconds))
+    return limits
+
+
+def _configured_windows(key: str) -> list[Any] | None:
+    """Return the raw ``concurrency.<key>`` list, or None when absent."""
+    from modules.config.loader import get_config_loader
+
+    concurrency_cfg = get_config_loader().get_concurrency_config() or {}
+    raw_limits = (concurrency_cfg.get("concurrency", {}) or {}).get(key)
+    return raw_limits if isinstance(raw_limits, list) else None
+
+
 def get_rate_limits() -> list[tuple[int, int]]:
     """Resolve the configured rate-limit windows, or permissive defaults.
 
@@ -220,39 +311,31 @@ def get_rate_limits() -> list[tuple[int, int]]:
     """
     default_limits = list(DEFAULT_RATE_LIMITS)
     try:
-        from modules.config.loader import get_config_loader
-
-        concurrency_cfg = get_config_loader().get_concurrency_config() or {}
-        raw_limits = (concurrency_cfg.get("concurrency", {}) or {}).get("rate_limits")
-
-        if not isinstance(raw_limits, list):
+        raw_limits = _configured_windows("rate_limits")
+        if raw_limits is None:
             return default_limits
-
-        limits: list[tuple[int, int]] = []
-        for item in raw_limits:
-            if not (isinstance(item, list | tuple) and len(item) == 2):
-                logger.warning("Skipping malformed rate_limits entry: %r", item)
-                continue
-            try:
-                max_requests, window_seconds = int(item[0]), int(item[1])
-            except (ValueError, TypeError):
-                logger.warning("Skipping non-integer rate_limits entry: %r", item)
-                continue
-            if max_requests < 1 or window_seconds <= 0:
-                logger.warning(
-                    "Skipping non-positive rate_limits entry (max_requests must "
-                    "be >= 1 and window_seconds > 0): %r",
-                    item,
-                )
-                continue
-            limits.append((max_requests, window_seconds))
-
+        limits = _parse_windows(raw_limits, "rate_limits")
         return limits if limits else default_limits
     except Exception as exc:
         logger.debug("Error loading rate limits: %s", exc)
         return default_limits
 
 
+def get_token_rate_limits() -> list[tuple[int, int]]:
+    """Resolve the configured token windows; none unless configured.
+
+    Reads ``concurrency.token_rate_limits`` (a list of ``[max_tokens, window]``
+    pairs). Token budgets are account-specific, so there is no default: an
+    absent, malformed, or unreadable block disables token limiting.
+    """
+    try:
+        raw_limits = _configured_windows("token_rate_limits")
+        return _parse_windows(raw_limits, "token_rate_limits") if raw_limits else []
+    except Exception as exc:
+        logger.debug("Error loading token rate limits: %s", exc)
+        return []
+
+
 # --------------------------------------------------------------------------- #
 # Shared per-provider limiters
 # --------------------------------------------------------------------------- #
@@ -268,7 +351,7 @@ def get_shared_rate_limiter(provider: str | None) -> RateLimiter:
     with _SHARED_LIMITERS_LOCK:
         limiter = _SHARED_LIMITERS.get(key)
         if limiter is None:
-            limiter = RateLimiter(get_rate_limits())
+            limiter = RateLimiter(get_rate_limits(), get_token_rate_limits())
             _SHARED_LIMITERS[key] = limiter
         return limiter
 
@@ -279,20 +362,24 @@ def reset_shared_rate_limiters() -> None:
         _SHARED_LIMITERS.clear()
 
 
-async def await_capacity(limiter: RateLimiter) -> float:
+async def await_capacity(limiter: RateLimiter, tokens: int = 0) -> float:
     """Acquire capacity from *limiter* without blocking the event loop.
 
     ``wait_for_capacity`` is synchronous and may sleep; running it via
     :func:`asyncio.to_thread` keeps the loop free for other coroutines.
 
+    :param tokens: Estimated token cost of the request (see
+        :func:`estimate_request_tokens`).
     :return: Total time waited, in seconds.
     """
-    return await asyncio.to_thread(limiter.wait_for_capacity)
+    return await asyncio.to_thread(limiter.wait_for_capacity, tokens)
 
 
 __all__ = [
     "RateLimiter",
+    "estimate_request_tokens",
     "get_rate_limits",
+    "get_token_rate_limits",
     "get_shared_rate_limiter",
     "reset_shared_rate_limiters",
     "await_capacity",
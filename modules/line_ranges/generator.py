@@ -28,14 +28,14 @@ def generate_line_ranges_for_file(
         A list of tuples representing line ranges.
     """
     # Mirror FileProcessor's tolerant read: UTF-8 first, then charset
-    # detection. A file that extracts fine must not crash range generation.
+    # detection on the same buffer. A file that extracts fine must not crash
+    # range generation.
+    data = text_file.read_bytes()
     try:
-        with text_file.open("r", encoding="utf-8") as f:
-            lines: list[str] = f.readlines()
+        text = data.decode("utf-8")
     except UnicodeDecodeError:
-        encoding = TextProcessor.detect_encoding(text_file)
-        with text_file.open("r", encoding=encoding) as f:
-            lines = f.readlines()
+        text = data.decode(TextProcessor.detect_encoding_bytes(data))
+    lines: list[str] = TextProcessor.split_lines(text)
 
     normalized_lines: list[str] = [TextProcessor.normalize_text(line) for line in lines]
     text_processor: TextProcessor = TextProcessor()
@@ -22,7 +22,9 @@ from modules.llm.langchain_provider import (
 from modules.llm.openai_utils import (
     LLMExtractor,
     open_extractor,
+    process_many,
     process_text_chunk,
+    process_text_chunks,
 )
 from modules.llm.prompt_utils import (
     load_prompt_template,
@@ -39,7 +41,9 @@ __all__ = [
     "detect_provider",
     "LLMExtractor",
     "open_extractor",
+    "process_many",
     "process_text_chunk",
+    "process_text_chunks",
     "load_prompt_template",
     "render_prompt_with_schema",
     "build_structured_text_format",
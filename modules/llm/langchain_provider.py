@@ -16,6 +16,7 @@ import asyncio
 import contextlib
 import inspect
 import json
+import logging
 import os
 from dataclasses import dataclass, field
 from typing import Any, Literal
@@ -284,8 +285,8 @@ class ProviderConfig:
                 "custom",
             ):
                 logger.warning(
-                    f"Unknown provider '{config_provider}', "
-                    "auto-detecting from model name"
+                    "Unknown provider '%s', auto-detecting from model name",
+                    config_provider,
                 )
                 provider = cls._detect_provider(model_name)
         else:
@@ -393,7 +394,7 @@ class ProviderConfig:
                 if key:
                     return key
             logger.warning(
-                f"Custom endpoint API key not found. Set env var: {env_var!r}"
+                "Custom endpoint API key not found. Set env var: %r", env_var
             )
             return None
         return resolve_api_key(provider)
@@ -487,15 +488,16 @@ class LangChainLLM:
             disabled["presence_penalty"] = None
             disabled["frequency_penalty"] = None
             logger.debug(
-                f"Model {self.config.model}: Disabled sampler controls "
-                "(reasoning model)"
+                "Model %s: Disabled sampler controls (reasoning model)",
+                self.config.model,
             )
 
         # Some models don't support structured outputs via response_format
         if not caps.supports_structured_outputs:
             disabled["response_format"] = None
             logger.debug(
-                f"Model {self.config.model}: Disabled response_format (not supported)"
+                "Model %s: Disabled response_format (not supported)",
+                self.config.model,
             )
 
         return disabled if disabled else None
@@ -589,9 +591,10 @@ class LangChainLLM:
                 params["service_tier"] = service_tier
             elif service_tier:
                 logger.info(
-                    f"Ignoring service_tier={service_tier!r} for "
-                    f"{self.config.model}: flex/priority tiers apply to "
-                    "reasoning models only."
+                    "Ignoring service_tier=%r for %s: flex/priority tiers apply "
+                    "to reasoning models only.",
+                    service_tier,
+                    self.config.model,
                 )
 
             # Route models without a Chat Completions endpoint (GPT-5.x) to the
@@ -636,9 +639,10 @@ class LangChainLLM:
             )
             if reasoning_requested and not caps.supports_thinking_budget:
                 logger.info(
-                    f"Model {self.config.model} does not take an explicit "
-                    "thinking budget (adaptive-thinking or pre-thinking "
-                    "model); skipping thinking budget_tokens/temperature."
+                    "Model %s does not take an explicit thinking budget "
+                    "(adaptive-thinking or pre-thinking model); skipping "
+                    "thinking budget_tokens/temperature.",
+                    self.config.model,
                 )
             if reasoning_requested and caps.supports_thinking_budget:
                 effort = reasoning_config.get("effort", "medium")
@@ -664,8 +668,10 @@ class LangChainLLM:
                         "structured-outputs-2025-11-13",
                     ]
                     logger.info(
-                        f"Anthropic extended thinking enabled: "
-                        f"budget_tokens={budget}, effort={effort}"
+                        "Anthropic extended thinking enabled: "
+                        "budget_tokens=%s, effort=%s",
+                        budget,
+                        effort,
                     )
 
             return ChatAnthropic(
@@ -707,8 +713,9 @@ class LangChainLLM:
                     level = level_map.get(effort.lower().strip(), "medium")
                     google_params["thinking_level"] = level
                     logger.info(
-                        f"Google thinking enabled: thinking_level={level}, "
-                        f"effort={effort}"
+                        "Google thinking enabled: thinking_level=%s, effort=%s",
+                        level,
+                        effort,
                     )
                 else:
                     budget = _compute_reasoning_budget(
@@ -718,8 +725,9 @@ class LangChainLLM:
                         google_params["thinking_budget"] = budget
                         google_params["include_thoughts"] = True
                         logger.info(
-                            f"Google thinking enabled: thinking_budget={budget}, "
-                            f"effort={effort}"
+                            "Google thinking enabled: thinking_budget=%s, effort=%s",
+                            budget,
+                            effort,
                         )
 
             return ChatGoogleGenerativeAI(
@@ -765,8 +773,9 @@ class LangChainLLM:
                 if reasoning_payload:
                     extra_body["reasoning"] = reasoning_payload
                     logger.info(
-                        f"Using OpenRouter reasoning={reasoning_payload} "
-                        f"for model {model_name}"
+                        "Using OpenRouter reasoning=%s for model %s",
+                        reasoning_payload,
+                        model_name,
                     )
                     # Anthropic rejects any temperature other than 1.0 (and
                     # rejects top_p outright) while thinking is enabled, and
@@ -814,8 +823,9 @@ class LangChainLLM:
                 params["disabled_params"] = disabled_params
 
             logger.info(
-                f"Creating custom endpoint model: {self.config.model} "
-                f"at {self.config.base_url}"
+                "Creating custom endpoint model: %s at %s",
+                self.config.model,
+                self.config.base_url,
             )
             return ChatOpenAI(**params)
 
@@ -1190,12 +1200,16 @@ class LangChainLLM:
                             key_env=self._key_env,
                             model=self.config.model,
                         )
-                        logger.debug(
-                            f"[TOKEN] API call consumed {committed_total:,} tokens "
-                            f"(daily total: {token_tracker.get_tokens_used_today():,})"
-                        )
+                        # The daily total is a tracker query; skip it (and the
+                        # formatting) unless DEBUG is actually enabled.
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "[TOKEN] API call consumed %s tokens (daily total: %s)",
+                                f"{committed_total:,}",
+                                f"{token_tracker.get_tokens_used_today():,}",
+                            )
                 except Exception as e:
-                    logger.warning(f"Error reporting token usage: {e}")
+                    logger.warning("Error reporting token usage: %s", e)
 
             # Store response metadata
             response_data["model"] = self.config.model
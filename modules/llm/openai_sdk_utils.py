@@ -10,32 +10,30 @@ For LangChain multi-provider support, see langchain_provider.py.
 
 from __future__ import annotations
 
-import json
+import sys
+import weakref
+from collections.abc import Callable
 from typing import Any
 
+from modules.infra.jsonl import fast_json_loads
 from modules.infra.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def sdk_to_dict(obj: Any) -> dict[str, Any]:
-    """Convert an OpenAI SDK object into a plain dict when possible."""
-    if isinstance(obj, dict):
-        return obj
-    for attr in ("model_dump", "to_dict"):
-        fn = getattr(obj, attr, None)
-        if callable(fn):
-            try:
-                return fn()
-            except Exception:
-                pass
-    try:
-        j = getattr(obj, "json", None)
-        if callable(j):
-            return json.loads(j())
-    except Exception:
-        pass
+def _via_model_dump(obj: Any) -> dict[str, Any]:
+    return obj.model_dump()
+
+
+def _via_to_dict(obj: Any) -> dict[str, Any]:
+    return obj.to_dict()
+
+
+def _via_json(obj: Any) -> dict[str, Any]:
+    return fast_json_loads(obj.json())
 
+
+def _via_attributes(obj: Any) -> dict[str, Any]:
     data: dict[str, Any] = {}
     for name in dir(obj):
         if name.startswith("_"):
@@ -46,7 +44,53 @@ def sdk_to_dict(obj: Any) -> dict[str, Any]:
                 data[name] = val
         except Exception:
             continue
-    if not data:
+    return data
+
+
+_Converter = Callable[[Any], dict[str, Any]]
+_CONVERTERS: tuple[_Converter, ...] = (_via_model_dump, _via_to_dict, _via_json)
+
+# Conversion strategy that last worked for each SDK class. Pages of batches are
+# homogeneous, so after the first item every lookup is a single dict hit rather
+# than a probe of model_dump/to_dict/json and, failing those, a dir() walk.
+# Weak keys let dynamically created classes be collected.
+_CONVERTER_CACHE: weakref.WeakKeyDictionary[type, _Converter] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def sdk_to_dict(obj: Any) -> dict[str, Any]:
+    """Convert an OpenAI SDK object into a plain dict when possible."""
+    if isinstance(obj, dict):
+        return obj
+    # OpenAI SDK objects are pydantic models: one isinstance check and a direct
+    # model_dump. pydantic is looked up rather than imported, since an SDK
+    # object can only exist once the SDK has imported it.
+    pydantic = sys.modules.get("pydantic")
+    if pydantic is not None and isinstance(obj, pydantic.BaseModel):
+        try:
+            return obj.model_dump()
+        except Exception:
+            pass
+    cls = type(obj)
+    cached = _CONVERTER_CACHE.get(cls)
+    if cached is not None:
+        try:
+            return cached(obj)
+        except Exception:
+            pass
+    for converter in _CONVERTERS:
+        try:
+            result = converter(obj)
+        except Exception:
+            continue
+        _CONVERTER_CACHE[cls] = converter
+        return result
+
+    data = _via_attributes(obj)
+    if data:
+        _CONVERTER_CACHE[cls] = _via_attributes
+    else:
         logger.warning(
             "Unable to convert SDK object %s to dict; returning empty mapping",
             type(obj),
@@ -67,19 +111,21 @@ def list_all_batches(client: Any, limit: int = 100) -> list[dict[str, Any]]:
             if after
             else client.batches.list(limit=limit)
         )
-        data = getattr(page, "data", None) or page
-        page_items = [sdk_to_dict(item) for item in data]
-        batches.extend(page_items)
 
         # A dict page needs explicit .get access: getattr(page, "has_more", ...)
         # on a dict returns the default without raising, so the SDK-object
-        # branch would silently stop dict-shaped pages after page 1.
+        # branch would silently stop dict-shaped pages after page 1 (and iterate
+        # the page's keys instead of its items).
         if isinstance(page, dict):
+            data = page.get("data") or []
             has_more = bool(page.get("has_more", False))
             last_id = page.get("last_id")
         else:
+            data = getattr(page, "data", None) or page
             has_more = bool(getattr(page, "has_more", False))
             last_id = getattr(page, "last_id", None)
+        page_items = [sdk_to_dict(item) for item in data]
+        batches.extend(page_items)
 
         logger.info(
             "Retrieved batches page %s (%s item(s)); has_more=%s",
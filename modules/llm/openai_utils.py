@@ -15,13 +15,16 @@ owned by the outer loop in ``SynchronousProcessingStrategy`` (LangChain's
 internal retries are disabled via ``max_retries=0``).
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+import itertools
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 from modules.config.capabilities import detect_capabilities
 from modules.config.loader import get_config_loader
+from modules.infra.jsonl import fast_json_dumps, fast_json_loads
 from modules.infra.logger import setup_logger
 from modules.llm.langchain_provider import (
     LangChainLLM,
@@ -39,6 +42,27 @@ def _numeric(tm: dict[str, Any], key: str, default: float) -> float:
     return float(default if value is None else value)
 
 
+def _section(cfg: dict[str, Any], *keys: str) -> dict[str, Any]:
+    """Nested config mapping at ``keys``; missing, null or non-dict yields {}."""
+    current: Any = cfg
+    for key in keys:
+        if not isinstance(current, dict):
+            return {}
+        current = current.get(key)
+    return current if isinstance(current, dict) else {}
+
+
+def _read_prompt(prompt_path: Path) -> str:
+    """Return the stripped prompt file text; a missing file yields ``""``."""
+    try:
+        return prompt_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return ""
+    except Exception as e:
+        logger.error("Failed to read prompt: %s", e)
+        raise
+
+
 class LLMExtractor:
     """
     A unified wrapper for interacting with LLM providers via LangChain.
@@ -47,6 +71,28 @@ class LLMExtractor:
     consistent interface for structured data extraction tasks.
     """
 
+    # Fixed attribute set: no per-instance __dict__, and the per-chunk reads
+    # (caps, provider, llm, the message/schema caches) are slot lookups.
+    __slots__ = (
+        "model",
+        "provider",
+        "api_key",
+        "prompt_text",
+        "model_config",
+        "concurrency_config",
+        "max_output_tokens",
+        "temperature",
+        "top_p",
+        "presence_penalty",
+        "frequency_penalty",
+        "reasoning",
+        "text_params",
+        "caps",
+        "_structured_schema_cache",
+        "_system_frame_cache",
+        "_llm",
+    )
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -55,6 +101,7 @@ class LLMExtractor:
         provider: ProviderType | None = None,
         model_config_override: dict[str, Any] | None = None,
         concurrency_config_override: dict[str, Any] | None = None,
+        prompt_text: str | None = None,
     ) -> None:
         if not model:
             raise ValueError("Model must be specified.")
@@ -71,15 +118,10 @@ class LLMExtractor:
                 raise ValueError(f"API key not found for provider {self.provider}")
             self.api_key = resolved_key
 
-        # Load prompt text if path provided
-        self.prompt_text: str = ""
-        if prompt_path and prompt_path.exists():
-            try:
-                with prompt_path.open("r", encoding="utf-8") as prompt_file:
-                    self.prompt_text = prompt_file.read().strip()
-            except Exception as e:
-                logger.error(f"Failed to read prompt: {e}")
-                raise
+        # Prompt text: pre-read by ``create`` or loaded from the path here.
+        if prompt_text is None:
+            prompt_text = _read_prompt(prompt_path) if prompt_path else ""
+        self.prompt_text: str = prompt_text
 
         # Load configuration using cached loader
         config = get_config_loader()
@@ -110,26 +152,60 @@ class LLMExtractor:
         # Capabilities gating
         self.caps = detect_capabilities(self.model, provider=self.provider)
 
+        # Last (caller schema, normalized structured schema) pair; see
+        # _structured_schema_for.
+        self._structured_schema_cache: (
+            tuple[dict[str, Any] | None, dict[str, Any] | None] | None
+        ) = None
+        # Last (system message, cache-control flag, system frame); see
+        # _system_frame_for.
+        self._system_frame_cache: tuple[str | None, bool, dict[str, Any]] | None = None
+
         # Create LangChain LLM instance
         self._llm: LangChainLLM | None = None
         self._initialize_llm()
 
+    @classmethod
+    async def create(
+        cls,
+        api_key: str | None = None,
+        prompt_path: Path | None = None,
+        model: str = "",
+        provider: ProviderType | None = None,
+        model_config_override: dict[str, Any] | None = None,
+        concurrency_config_override: dict[str, Any] | None = None,
+    ) -> "LLMExtractor":
+        """
+        Build an extractor from async code without blocking the event loop.
+
+        The prompt file is read in a worker thread; the rest of construction
+        is in-memory (configs come from the cached loader).
+        """
+        prompt_text = (
+            await asyncio.to_thread(_read_prompt, prompt_path) if prompt_path else ""
+        )
+        return cls(
+            api_key=api_key,
+            model=model,
+            provider=provider,
+            model_config_override=model_config_override,
+            concurrency_config_override=concurrency_config_override,
+            prompt_text=prompt_text,
+        )
+
     def _initialize_llm(self) -> None:
         """Initialize the LangChain LLM instance."""
         # Load service_tier from concurrency config (CM-1)
-        extraction_cfg = (self.concurrency_config.get("concurrency", {}) or {}).get(
-            "extraction", {}
-        ) or {}
+        extraction_cfg = _section(self.concurrency_config, "concurrency", "extraction")
         service_tier = extraction_cfg.get("service_tier")
 
+        # Models without sampler controls get neutral values for all four.
+        sampler_on = self.caps.supports_sampler_controls
+
         # Build extra_params including reasoning (CM-3) and service_tier (CM-1)
         extra_params: dict[str, Any] = {
-            "presence_penalty": self.presence_penalty
-            if self.caps.supports_sampler_controls
-            else 0.0,
-            "frequency_penalty": self.frequency_penalty
-            if self.caps.supports_sampler_controls
-            else 0.0,
+            "presence_penalty": self.presence_penalty if sampler_on else 0.0,
+            "frequency_penalty": self.frequency_penalty if sampler_on else 0.0,
             "reasoning_config": self.reasoning,
             "reasoning_effort": self.reasoning.get("effort", "medium"),
             "text_config": self.text_params,
@@ -145,7 +221,7 @@ class LLMExtractor:
         # the configured value never reached live calls).
         try:
             timeout_total = float(
-                (extraction_cfg.get("timeouts", {}) or {}).get("total") or 600.0
+                _section(extraction_cfg, "timeouts").get("total") or 600.0
             )
         except (TypeError, ValueError):
             timeout_total = 600.0
@@ -153,11 +229,9 @@ class LLMExtractor:
             provider=self.provider,
             model=self.model,
             api_key=self.api_key,
-            temperature=self.temperature
-            if self.caps.supports_sampler_controls
-            else 0.0,
+            temperature=self.temperature if sampler_on else 0.0,
             max_tokens=self.max_output_tokens,
-            top_p=self.top_p if self.caps.supports_sampler_controls else 1.0,
+            top_p=self.top_p if sampler_on else 1.0,
             max_retries=0,
             timeout=timeout_total,
             extra_params=extra_params,
@@ -213,7 +287,7 @@ async def open_extractor(
     :param provider: Optional provider type override.
     :yield: An instance of LLMExtractor.
     """
-    extractor = LLMExtractor(
+    extractor = await LLMExtractor.create(
         api_key=api_key,
         prompt_path=prompt_path,
         model=model,
@@ -227,6 +301,31 @@ async def open_extractor(
         await extractor.close()
 
 
+def _system_frame_for(
+    extractor: LLMExtractor, system_message: str | None, enable_cache_control: bool
+) -> dict[str, Any]:
+    """
+    Return the system-role message, cached on the extractor.
+
+    The system prompt is rendered once per file and is identical for every
+    chunk, so the frame is built once and shared across calls. It is never
+    mutated downstream (``LangChainLLM._to_lc_messages`` copies content).
+    """
+    cached = getattr(extractor, "_system_frame_cache", None)
+    if (
+        isinstance(cached, tuple)
+        and cached[1] == enable_cache_control
+        and cached[0] == system_message
+    ):
+        return cached[2]
+    system_block: dict[str, Any] = {"type": "input_text", "text": system_message or ""}
+    if enable_cache_control:
+        system_block["cache_control"] = {"type": "ephemeral"}
+    frame = {"role": "system", "content": [system_block]}
+    extractor._system_frame_cache = (system_message, enable_cache_control, frame)
+    return frame
+
+
 def _build_messages(
     system_message: str | None,
     user_blocks: list[dict[str, Any]],
@@ -242,21 +341,16 @@ def _build_messages(
     injects an optional context image ahead of the caller's ``user_blocks``
     (OpenAI and OpenRouter only), and wraps both into the role envelope.
 
-    :param system_message: Optional system prompt; treated as empty when None.
+    :param system_message: Optional system prompt; the system message is
+        omitted when it is None or empty.
     :param user_blocks: The caller's trailing user-content blocks (text chunk,
         or instruction plus image), appended after any context image.
     :param extractor: The active extractor, used for provider gating.
     :param enable_cache_control: Whether to mark the system block ephemeral.
     :param context_image_data: Optional context image dict with 'base64',
         'mime_type', and 'detail' keys.
-    :return: The two-element system/user message list.
+    :return: The system/user message list (user only without a system prompt).
     """
-    system_content: list[dict[str, Any]] = [
-        {"type": "input_text", "text": system_message or ""}
-    ]
-    if enable_cache_control:
-        system_content[-1]["cache_control"] = {"type": "ephemeral"}
-
     user_content: list[dict[str, Any]] = []
     if context_image_data is not None:
         if extractor.provider.lower() in ("openai", "openrouter"):
@@ -276,14 +370,20 @@ def _build_messages(
             user_content.append(ctx_block)
         else:
             logger.warning(
-                "Context image injection not yet supported for "
-                f"provider '{extractor.provider}'. Skipping."
+                "Context image injection not yet supported for provider '%s'. "
+                "Skipping.",
+                extractor.provider,
             )
     user_content.extend(user_blocks)
 
+    user_frame = {"role": "user", "content": user_content}
+    # An empty system prompt would still cost a framed message per call (and
+    # Anthropic rejects cache_control on an empty text block); omit it.
+    if not system_message:
+        return [user_frame]
     return [
-        {"role": "system", "content": system_content},
-        {"role": "user", "content": user_content},
+        _system_frame_for(extractor, system_message, enable_cache_control),
+        user_frame,
     ]
 
 
@@ -312,6 +412,24 @@ def _normalize_structured_schema(
     }
 
 
+def _structured_schema_for(
+    extractor: LLMExtractor, json_schema: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """
+    Return the normalized structured schema, cached on the extractor.
+
+    Every chunk of a file passes the same schema object, so the normalized
+    form is built once per extractor and reused while the caller's schema
+    object is unchanged (identity check); a different schema rebuilds it.
+    """
+    cached = getattr(extractor, "_structured_schema_cache", None)
+    if isinstance(cached, tuple) and cached[0] is json_schema:
+        return cached[1]
+    structured_schema = _normalize_structured_schema(json_schema, extractor.caps)
+    extractor._structured_schema_cache = (json_schema, structured_schema)
+    return structured_schema
+
+
 def _pack_result(result: dict[str, Any]) -> dict[str, Any]:
     """Extract the public response fields from a raw LLM result."""
     response_data = result.get("response_data", {})
@@ -353,7 +471,7 @@ async def process_text_chunk(
         enable_cache_control=enable_cache_control,
         context_image_data=context_image_data,
     )
-    structured_schema = _normalize_structured_schema(json_schema, extractor.caps)
+    structured_schema = _structured_schema_for(extractor, json_schema)
 
     # Retries live in the caller (SynchronousProcessingStrategy); token
     # tracking is handled via usage_metadata on the response.
@@ -364,6 +482,204 @@ async def process_text_chunk(
     return _pack_result(result)
 
 
+def _extraction_concurrency(extractor: LLMExtractor) -> int:
+    """``concurrency.extraction.concurrency_limit`` (at least 1; 1 if unset)."""
+    extraction_cfg = _section(extractor.concurrency_config, "concurrency", "extraction")
+    try:
+        return max(1, int(extraction_cfg.get("concurrency_limit") or 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+async def process_many(
+    text_chunks: Iterable[str],
+    extractor: LLMExtractor,
+    system_message: str | None = None,
+    json_schema: dict | None = None,
+    concurrency: int | None = None,
+    enable_cache_control: bool = False,
+) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    """
+    Run :func:`process_text_chunk` over many chunks with bounded concurrency.
+
+    Yields ``(index, result)`` pairs in completion order. At most
+    ``concurrency`` calls are in flight (default: the configured extraction
+    ``concurrency_limit``) and new chunks are only pulled from
+    ``text_chunks`` as slots free up, so a large or lazy input never turns
+    into thousands of pending tasks. If a call raises, or the consumer stops
+    early, the remaining in-flight calls are cancelled.
+
+    :param text_chunks: The texts to process (any iterable, consumed lazily).
+    :param extractor: An instance of LLMExtractor.
+    :param system_message: Optional system message.
+    :param json_schema: Optional JSON schema for response formatting.
+    :param concurrency: Maximum in-flight calls; overrides the config value.
+    :yield: ``(index, result)`` with ``index`` the chunk's input position.
+    """
+    limit = max(1, concurrency) if concurrency else _extraction_concurrency(extractor)
+
+    async def _run(index: int, chunk: str) -> tuple[int, dict[str, Any]]:
+        result = await process_text_chunk(
+            text_chunk=chunk,
+            extractor=extractor,
+            system_message=system_message,
+            json_schema=json_schema,
+            enable_cache_control=enable_cache_control,
+        )
+        return index, result
+
+    chunks = enumerate(text_chunks)
+    pending: set[asyncio.Task[tuple[int, dict[str, Any]]]] = set()
+    done: set[asyncio.Task[tuple[int, dict[str, Any]]]] = set()
+    try:
+        while True:
+            for index, chunk in itertools.islice(chunks, limit - len(pending)):
+                pending.add(asyncio.create_task(_run(index, chunk)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            while done:
+                yield done.pop().result()
+    finally:
+        for task in pending:
+            task.cancel()
+        # Wait for the cancellations to land and retrieve the outcome of every
+        # task not yielded (including siblings that failed in the same round),
+        # so none is left running or with an unretrieved exception.
+        await asyncio.gather(*pending, *done, return_exceptions=True)
+
+
+def _batched_schema(structured_schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Wrap a normalized structured schema so one response carries K results.
+
+    Structured outputs need an object root, so the per-chunk schema becomes
+    the item type of a required ``results`` array. ``$defs``/``definitions``
+    are hoisted to the new root because ``$ref`` pointers are root-relative.
+    """
+    item_schema = dict(structured_schema["schema"])
+    root: dict[str, Any] = {
+        "type": "object",
+        "properties": {"results": {"type": "array", "items": item_schema}},
+        "required": ["results"],
+        "additionalProperties": False,
+    }
+    for defs_key in ("$defs", "definitions"):
+        if defs_key in item_schema:
+            root[defs_key] = item_schema.pop(defs_key)
+    return {
+        "name": f"{structured_schema['name']}Batch",
+        "schema": root,
+        "strict": structured_schema["strict"],
+    }
+
+
+async def process_text_chunks(
+    text_chunks: list[str],
+    extractor: LLMExtractor,
+    system_message: str | None = None,
+    json_schema: dict | None = None,
+    enable_cache_control: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Process several text chunks with one structured-output call.
+
+    The chunks are sent as tagged blocks of a single user message and the
+    schema is wrapped in a ``results`` array, so K chunks share one round
+    trip and one copy of the system prompt. Results are returned in chunk
+    order, each shaped like a :func:`process_text_chunk` result; usage is
+    reported on the first result only since it covers the whole call.
+
+    Without structured-output support, or when the batched call returns
+    unparseable output or the wrong number of results, each chunk is processed
+    on its own. Errors raised by the call itself propagate to the caller.
+
+    :param text_chunks: The texts to process.
+    :param extractor: An instance of LLMExtractor.
+    :param system_message: Optional system message.
+    :param json_schema: JSON schema for one chunk's response.
+    :return: One result dictionary per chunk, in input order.
+    """
+    structured_schema = _structured_schema_for(extractor, json_schema)
+    if len(text_chunks) > 1 and structured_schema is not None:
+        user_blocks: list[dict[str, Any]] = [
+            {
+                "type": "input_text",
+                "text": (
+                    f"The input contains {len(text_chunks)} chunks. Process each "
+                    "chunk independently and return one entry per chunk, in "
+                    "chunk order, in the `results` array."
+                ),
+            }
+        ]
+        user_blocks.extend(
+            {"type": "input_text", "text": f'<chunk id="{i}">\n{chunk}\n</chunk>'}
+            for i, chunk in enumerate(text_chunks)
+        )
+        messages = _build_messages(
+            system_message,
+            user_blocks,
+            extractor=extractor,
+            enable_cache_control=enable_cache_control,
+            context_image_data=None,
+        )
+        # API errors propagate: rate limits, timeouts and server errors belong
+        # to the caller's retry loop, and re-sending every chunk on its own
+        # would only multiply the load that triggered them.
+        result = await extractor.llm.ainvoke_with_structured_output(
+            messages=messages,
+            json_schema=_batched_schema(structured_schema),
+        )
+        try:
+            items = fast_json_loads(result.get("output_text") or "").get("results")
+        except (ValueError, AttributeError) as e:
+            logger.warning(
+                "Batched call for %d chunks returned unparseable output (%s); "
+                "processing chunks individually.",
+                len(text_chunks),
+                e,
+            )
+            items = None
+        if isinstance(items, list) and len(items) == len(text_chunks):
+            packed = _pack_result(result)
+            usage = packed["usage"]
+            shared = {k: v for k, v in packed["response_data"].items() if k != "usage"}
+            shared["batch_size"] = len(items)
+            results = []
+            for i, item in enumerate(items):
+                response_data = {**shared, "batch_index": i}
+                if i == 0 and usage:
+                    response_data["usage"] = usage
+                results.append(
+                    {
+                        "output_text": fast_json_dumps(item),
+                        "response_data": response_data,
+                        "request_metadata": packed["request_metadata"],
+                        "usage": usage if i == 0 else {},
+                    }
+                )
+            return results
+        if items is not None:
+            logger.warning(
+                "Batched call returned an unusable result for %d chunks; "
+                "processing chunks individually.",
+                len(text_chunks),
+            )
+
+    return [
+        await process_text_chunk(
+            text_chunk=chunk,
+            extractor=extractor,
+            system_message=system_message,
+            json_schema=json_schema,
+            enable_cache_control=enable_cache_control,
+        )
+        for chunk in text_chunks
+    ]
+
+
 async def process_image_chunk(
     image_base64: str,
     mime_type: str,
@@ -420,7 +736,7 @@ async def process_image_chunk(
         enable_cache_control=enable_cache_control,
         context_image_data=context_image_data,
     )
-    structured_schema = _normalize_structured_schema(json_schema, extractor.caps)
+    structured_schema = _structured_schema_for(extractor, json_schema)
 
     result = await extractor.llm.ainvoke_with_structured_output(
         messages=messages,
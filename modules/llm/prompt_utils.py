@@ -1,16 +1,55 @@
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
 from typing import Any
 
+from modules.infra.jsonl import fast_json_dumps
+
 # Absolute path to the bundled ``prompts/`` directory, anchored via ``__file__``
 # (same pattern as modules/config/loader.py and schema_manager.py). Every prompt
 # template must be resolved through this so entry points run correctly from any
 # working directory, not only the repo root.
 PROMPTS_DIR = Path(__file__).resolve().parents[2] / "prompts"
 
+# Section patterns stripped when a placeholder has nothing to fill it. Compiled
+# once at import rather than re-parsed on every render (one render per file).
+_CONTEXT_SECTION_RE = re.compile(r"Context:\s*\n\s*\{\{CONTEXT\}\}\s*\n?")
+_SCHEMA_SECTION_RE = re.compile(
+    r"The JSON schema:\s*\n\s*\{\{TRANSCRIPTION_SCHEMA\}\}\s*\n?"
+)
+# Inline-schema replacement: locate the marker and its opening brace in one
+# search, then hop brace to brace to find the matching close. A single
+# ``\{.*\}`` regex cannot balance braces (greedy swallows trailing prose,
+# non-greedy stops inside nested objects).
+_SCHEMA_MARKER_RE = re.compile(r"The JSON schema:[^{]*(\{)")
+_BRACE_RE = re.compile(r"[{}]")
+
+# Serialized schemas keyed by ``id(schema_obj)``. Callers pass the same loaded
+# schema dict for every chunk (the readjuster renders once per chunk against a
+# module constant), so the dump is paid once per schema. Each entry holds the
+# object itself: that pins the id against reuse by a later object, and the
+# identity check on lookup rejects any stale entry. Schemas are treated as
+# immutable once loaded.
+_SCHEMA_STR_CACHE: dict[int, tuple[dict[str, Any], str]] = {}
+_SCHEMA_STR_CACHE_MAX = 32
+
+
+def _schema_to_str(schema_obj: dict[str, Any]) -> str:
+    """Return the compact JSON text of a schema, memoized per schema object."""
+    key = id(schema_obj)
+    cached = _SCHEMA_STR_CACHE.get(key)
+    if cached is not None and cached[0] is schema_obj:
+        return cached[1]
+    try:
+        schema_str = fast_json_dumps(schema_obj)
+    except Exception:
+        return str(schema_obj)
+    if len(_SCHEMA_STR_CACHE) >= _SCHEMA_STR_CACHE_MAX:
+        _SCHEMA_STR_CACHE.clear()
+    _SCHEMA_STR_CACHE[key] = (schema_obj, schema_str)
+    return schema_str
+
 
 def prompt_path(name: str) -> Path:
     """Return the absolute path to a bundled prompt template by file name."""
@@ -44,22 +83,26 @@ def render_prompt_with_schema(
     str
         The rendered prompt with schema and context injected
     """
+    # Every placeholder opens with "{{": one scan rules them all out at once,
+    # so a placeholder-free template only pays for the schema step below.
+    has_placeholders = "{{" in prompt_text
+    if not has_placeholders and (not inject_schema or not schema_obj):
+        return prompt_text
+
     schema_name_token = "{{SCHEMA_NAME}}"
-    if schema_name_token in prompt_text:
+    if has_placeholders and schema_name_token in prompt_text:
         prompt_text = prompt_text.replace(schema_name_token, schema_name or "")
 
     # Handle unified context placeholder
     context_placeholder = "{{CONTEXT}}"
-    if context_placeholder in prompt_text:
+    if has_placeholders and context_placeholder in prompt_text:
         if context and context.strip():
             # Replace with actual context
             prompt_text = prompt_text.replace(context_placeholder, context.strip())
         else:
             # Remove entire context section to save tokens
             # Pattern: "Context:\n{{CONTEXT}}\n"
-            prompt_text = re.sub(
-                r"Context:\s*\n\s*\{\{CONTEXT\}\}\s*\n?", "", prompt_text
-            )
+            prompt_text = _CONTEXT_SECTION_RE.sub("", prompt_text)
             # Fallback: just remove the placeholder
             prompt_text = prompt_text.replace(context_placeholder, "")
 
@@ -71,62 +114,41 @@ def render_prompt_with_schema(
             # shipped templates ("The JSON schema:\n{{TRANSCRIPTION_SCHEMA}}")
             # keep an orphaned header announcing a schema that never follows.
             # Same treatment the {{CONTEXT}} branch above applies.
-            prompt_text = re.sub(
-                r"The JSON schema:\s*\n\s*\{\{TRANSCRIPTION_SCHEMA\}\}\s*\n?",
-                "",
-                prompt_text,
-            )
+            prompt_text = _SCHEMA_SECTION_RE.sub("", prompt_text)
             # Fallback: just remove the placeholder
             return prompt_text.replace(schema_placeholder, "")
         return prompt_text
 
-    try:
-        schema_str = json.dumps(
-            schema_obj,
-            ensure_ascii=False,
-            separators=(",", ":"),
-        )
-    except Exception:
-        schema_str = str(schema_obj)
+    schema_str = _schema_to_str(schema_obj)
 
-    if schema_placeholder in prompt_text:
+    if has_placeholders and schema_placeholder in prompt_text:
         return prompt_text.replace(schema_placeholder, schema_str)
 
-    marker = "The JSON schema:"
-    if marker in prompt_text:
-        idx = prompt_text.find(marker)
-        start_brace = prompt_text.find("{", idx)
-        if start_brace != -1:
-            # Brace-balance forward from the start brace so only the JSON block
-            # is replaced. Using rfind("}") would swallow any prose after the
-            # schema that contains a later closing brace.
-            depth = 0
-            end_brace = -1
-            for i in range(start_brace, len(prompt_text)):
-                ch = prompt_text[i]
-                if ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
-                    if depth == 0:
-                        end_brace = i
-                        break
-            if end_brace != -1:
+    marker_match = _SCHEMA_MARKER_RE.search(prompt_text)
+    if marker_match is not None:
+        start_brace = marker_match.start(1)
+        # Brace-balance forward from the start brace so only the JSON block
+        # is replaced. Using rfind("}") would swallow any prose after the
+        # schema that contains a later closing brace.
+        depth = 0
+        for brace in _BRACE_RE.finditer(prompt_text, start_brace):
+            depth += 1 if brace.group() == "{" else -1
+            if depth == 0:
                 return (
-                    prompt_text[:start_brace]
-                    + schema_str
-                    + prompt_text[end_brace + 1 :]
+                    prompt_text[:start_brace] + schema_str + prompt_text[brace.end() :]
                 )
         return prompt_text + "\n" + schema_str
+    if "The JSON schema:" in prompt_text:
+        return prompt_text + "\n" + schema_str
 
     return prompt_text + "\n\nThe JSON schema:\n" + schema_str
 
 
 def load_prompt_template(prompt_path: Path) -> str:
     """Load and return the stripped prompt template text."""
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt file does not exist: {prompt_path}")
-
-    with prompt_path.open("r", encoding="utf-8") as prompt_file:
-        return prompt_file.read().strip()
+    # Open directly instead of exists() + open(): one stat fewer, and no
+    # window for the file to vanish between the check and the read.
+    try:
+        return prompt_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Prompt file does not exist: {prompt_path}") from exc
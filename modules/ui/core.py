@@ -1060,6 +1060,7 @@ class UserInterface:
         complete_count: int | None = None,
         partial_count: int = 0,
         skipped_count: int = 0,
+        submitted_count: int = 0,
         failed_files: list[str] | None = None,
         partial_files: list[str] | None = None,
         tokens_this_run: int | None = None,
@@ -1080,6 +1081,8 @@ class UserInterface:
             skipped). Defaults to None so older callers keep working.
         :param partial_count: Files that completed only partially
         :param skipped_count: Files skipped (already fully processed)
+        :param submitted_count: Files submitted as batch jobs by the
+            auto-batch threshold during a synchronous run
         :param failed_files: Names of files that failed (input order)
         :param partial_files: Names of files that completed partially
         :param tokens_this_run: Tokens consumed by this run (daily-counter
@@ -1102,7 +1105,8 @@ class UserInterface:
             partial = 0
             failed = failed_count
             skipped = 0
-        total_count = complete + partial + failed + skipped
+        submitted = submitted_count
+        total_count = complete + partial + failed + skipped + submitted
 
         # === Results Section ===
         self.console_print(f"  {self.BOLD}Results:{self.RESET}")
@@ -1111,7 +1115,7 @@ class UserInterface:
         if use_batch:
             self.print_success("Batch processing jobs have been submitted!")
             self.console_print(f"    - Jobs submitted: {total_count}")
-        elif failed == 0 and partial == 0 and (complete + skipped) > 0:
+        elif failed == 0 and partial == 0 and submitted == 0 and complete + skipped:
             self.print_success(
                 f"All {complete + skipped} file(s) processed successfully!"
             )
@@ -1121,6 +1125,8 @@ class UserInterface:
                 self.print_warning(f"    - Partial:  {partial} file(s)")
             if skipped > 0:
                 self.console_print(f"    - Skipped:  {skipped} file(s)")
+            if submitted > 0:
+                self.console_print(f"    - Batch:    {submitted} file(s) submitted")
             if failed > 0:
                 self.print_warning(f"    - Failed:   {failed} file(s)")
         else:
@@ -1180,7 +1186,7 @@ class UserInterface:
         self.console_print(self.HORIZONTAL_LINE)
 
         # === Next Steps (for batch mode) ===
-        if use_batch:
+        if use_batch or submitted:
             self.console_print(f"\n  {self.BOLD}Next steps:{self.RESET}")
             self.console_print(self.HORIZONTAL_LINE)
             self.console_print(
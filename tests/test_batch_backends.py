@@ -1087,6 +1087,123 @@ class TestOpenAIVisualBatchRouting:
         assert "IMGDATA" in user_content[0]["image_url"]
 
 
+class TestOpenAIBatchBodySkeleton:
+    """submit_batch builds the invariant body once and varies only the user
+    message per request."""
+
+    def setup_method(self):
+        clear_backend_cache()
+
+    @patch("openai.OpenAI")
+    def test_mixed_requests_share_one_skeleton(self, mock_openai_class):
+        import json
+
+        from modules.batch.backends import openai_backend
+
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        captured_jsonl: list = []
+
+        def _capture_file(file, purpose):
+            captured_jsonl.extend(file.read().decode("utf-8").strip().split("\n"))
+            return MagicMock(id="file-mixed")
+
+        mock_client.files.create.side_effect = _capture_file
+        mock_client.batches.create.return_value = MagicMock(id="batch-mixed")
+
+        model_config = {
+            "extraction_model": {"name": "gpt-4o", "max_output_tokens": 512}
+        }
+        schema = {"name": "Entries", "schema": {"type": "object"}}
+        requests = [
+            BatchRequest(custom_id="t-1", text="first", order_index=1),
+            BatchRequest(
+                custom_id="i-2",
+                image_base64="IMGDATA",
+                mime_type="image/png",
+                order_index=2,
+            ),
+            BatchRequest(custom_id="t-3", text="third", order_index=3),
+        ]
+
+        with (
+            patch.dict("os.environ", {"OPENAI_API_KEY": "test"}),
+            patch.object(
+                openai_backend,
+                "_build_body_skeleton",
+                wraps=openai_backend._build_body_skeleton,
+            ) as skeleton_spy,
+        ):
+            backend = get_batch_backend("openai")
+            backend.submit_batch(
+                requests, model_config, system_prompt="sys", schema=schema
+            )
+
+        assert skeleton_spy.call_count == 1
+        bodies = [json.loads(line)["body"] for line in captured_jsonl]
+        assert bodies[0] == openai_backend._build_responses_body(
+            model_config=model_config,
+            system_prompt="sys",
+            user_text="first",
+            schema=schema,
+        )
+        assert bodies[1] == openai_backend._build_image_responses_body(
+            model_config=model_config,
+            system_prompt="sys",
+            image_base64="IMGDATA",
+            mime_type="image/png",
+            schema=schema,
+        )
+        assert bodies[2]["input"][1]["content"][0]["text"] == "Input text:\nthird"
+        assert all(body["text"]["format"]["name"] == "Entries" for body in bodies)
+        assert len({body["prompt_cache_key"] for body in bodies}) == 1
+
+    @patch("openai.OpenAI")
+    def test_flex_remap_logged_once_per_submission(self, mock_openai_class, caplog):
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.files.create.return_value = MagicMock(id="file-flex")
+        mock_client.batches.create.return_value = MagicMock(id="batch-flex")
+        model_config = {
+            "extraction_model": {
+                "name": "gpt-4o",
+                "max_output_tokens": 512,
+                "service_tier": "flex",
+            }
+        }
+        requests = [
+            BatchRequest(custom_id=f"t-{i}", text=f"chunk {i}", order_index=i)
+            for i in range(1, 4)
+        ]
+
+        with (
+            patch.dict("os.environ", {"OPENAI_API_KEY": "test"}),
+            caplog.at_level("INFO", logger="modules.batch.backends.openai_backend"),
+        ):
+            backend = get_batch_backend("openai")
+            backend.submit_batch(requests, model_config, system_prompt="sys")
+            backend.submit_batch(requests, model_config, system_prompt="sys")
+
+        remaps = [r for r in caplog.records if "service_tier='flex'" in r.message]
+        assert len(remaps) == 2
+
+    def test_prompt_cache_key_tracks_prompt_and_schema(self):
+        from modules.batch.backends.openai_backend import _build_body_skeleton
+
+        model_config = {"extraction_model": {"name": "gpt-4o"}}
+        schema = {"name": "Entries", "schema": {"type": "object"}}
+
+        def key(system_prompt, schema):
+            return _build_body_skeleton(
+                model_config=model_config, system_prompt=system_prompt, schema=schema
+            ).get("prompt_cache_key")
+
+        assert key("sys", schema) == key("sys", dict(schema))
+        assert key("sys", schema) != key("other", schema)
+        assert key("sys", schema) != key("sys", None)
+        assert key("", schema) is None
+
+
 class TestAnthropicVisualBatchRouting:
     """Test Anthropic backend routes visual requests with image source blocks."""
 
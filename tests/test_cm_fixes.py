@@ -556,6 +556,38 @@ class TestCM7EmptyOutputPath:
         )
         assert working == output_dir
 
+    @pytest.mark.unit
+    def test_output_dirs_prepared_once_per_processor(self, tmp_path, monkeypatch):
+        """Files sharing an output folder do not re-mkdir or re-resolve it."""
+        from pathlib import Path
+
+        from modules.extract.file_processor import FileProcessor
+
+        output_dir = tmp_path / "output"
+        fp = FileProcessor(
+            paths_config={
+                "general": {
+                    "input_paths_is_output_path": False,
+                    "retain_temporary_jsonl": True,
+                }
+            },
+            model_config={"extraction_model": {"name": "gpt-4o"}},
+            chunking_config={"chunking": {}},
+        )
+        fp._setup_output_paths(tmp_path / "a.txt", {"output": str(output_dir)})
+
+        calls = []
+        monkeypatch.setattr(Path, "mkdir", lambda self, **kw: calls.append(self))
+        monkeypatch.setattr(Path, "resolve", lambda self: calls.append(self) or self)
+        _, out_json, out_jsonl = fp._setup_output_paths(
+            tmp_path / "b.txt", {"output": str(output_dir)}
+        )
+
+        assert calls == []
+        assert out_json == output_dir / "b_output.json"
+        assert out_jsonl == output_dir / "temp_jsonl" / "b_temp.jsonl"
+        assert (output_dir / "temp_jsonl").is_dir()
+
 
 # ---------------------------------------------------------------------------
 # CM-8: Context-selection step in interactive mode
@@ -974,3 +1006,15 @@ class TestNumericConfigCoercion:
         assert _numeric(tm, "max_output_tokens", 4096) == 4096
         assert _numeric(tm, "top_p", 1.0) == 0.5
         assert _numeric(tm, "absent_key", 2.5) == 2.5
+
+    @pytest.mark.unit
+    def test_null_or_scalar_config_sections_read_as_empty(self):
+        from modules.llm.openai_utils import _section
+
+        cfg = {"concurrency": {"extraction": {"timeouts": None, "retry": 3}}}
+        assert _section(cfg, "concurrency", "extraction", "timeouts") == {}
+        assert _section(cfg, "concurrency", "extraction", "retry", "attempts") == {}
+        assert _section({"concurrency": None}, "concurrency", "extraction") == {}
+        assert _section(cfg, "concurrency") == {
+            "extraction": cfg["concurrency"]["extraction"]
+        }
@@ -12,7 +12,7 @@ def test_document_converter_convert_to_txt_writes_message_when_no_entries(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     converter = DocumentConverter(schema_name="StructuredSummaries")
-    monkeypatch.setattr(converter, "get_entries", lambda _path: [])
+    monkeypatch.setattr(converter, "get_entries", lambda _path, _entries=None: [])
 
     json_file = tmp_path / "input.json"
     json_file.write_text("{}", encoding="utf-8")
@@ -29,7 +29,7 @@ def test_csv_converter_convert_to_csv_writes_header_when_no_entries(
 ) -> None:
     """An empty entry list still yields a file, matching the DOCX/TXT paths."""
     converter = CSVConverter(schema_name="StructuredSummaries")
-    monkeypatch.setattr(converter, "get_entries", lambda _path: [])
+    monkeypatch.setattr(converter, "get_entries", lambda _path, _entries=None: [])
 
     json_file = tmp_path / "input.json"
     json_file.write_text("{}", encoding="utf-8")
@@ -48,7 +48,7 @@ def test_csv_converter_writes_empty_file_without_field_spec(
 ) -> None:
     """Schemas without a declarative field spec still get a (empty) file."""
     converter = CSVConverter(schema_name="BibliographicEntries")
-    monkeypatch.setattr(converter, "get_entries", lambda _path: [])
+    monkeypatch.setattr(converter, "get_entries", lambda _path, _entries=None: [])
 
     json_file = tmp_path / "input.json"
     json_file.write_text("{}", encoding="utf-8")
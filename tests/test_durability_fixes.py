@@ -142,6 +142,19 @@ def test_atomic_write_json_writes_and_leaves_no_tmp(tmp_path: Path) -> None:
     assert list(tmp_path.glob("*.tmp")) == []
 
 
+@pytest.mark.unit
+def test_atomic_write_json_streams_same_bytes_as_dumps(tmp_path: Path) -> None:
+    from modules.infra.jsonl import atomic_write_json
+
+    data = {"__metadata__": {"n": 2}, "records": [{"t": "Küche", "v": [1.5, None]}]}
+    dest = tmp_path / "out.json"
+    atomic_write_json(dest, data)
+
+    assert dest.read_text(encoding="utf-8") == json.dumps(
+        data, indent=2, ensure_ascii=False
+    )
+
+
 @pytest.mark.unit
 def test_atomic_write_json_preserves_prior_file_on_failure(tmp_path: Path) -> None:
     from modules.infra.jsonl import atomic_write_json
@@ -481,3 +481,297 @@ def test_visual_batch_resume_skips_completed_pages(
     status = asyncio.run(_run())
     assert status == "skipped", "an already-completed page must not be re-submitted"
     assert called["strategy"] is False
+
+
+@pytest.mark.unit
+def test_temp_readers_skip_header_malformed_and_undecodable_lines(tmp_path: Path):
+    from modules.extract.file_processor import (
+        _completed_indices_from_temp,
+        _read_temp_records,
+    )
+
+    temp = tmp_path / "doc_temp.jsonl"
+    record = {
+        "custom_id": "doc-chunk-1",
+        "chunk_index": 1,
+        "chunk_range": [1, 5],
+        "response": {"body": {"output_text": "Küche"}},
+    }
+    temp.write_bytes(
+        b'{"__header__": true}\n'
+        + json.dumps(record, ensure_ascii=False).encode("utf-8")
+        + b"\n\n{not json\n"
+        + b'{"custom_id": "\xff", "chunk_index": 2}\n'
+    )
+
+    assert _read_temp_records(temp) == [
+        {
+            "custom_id": "doc-chunk-1",
+            "chunk_index": 1,
+            "chunk_range": [1, 5],
+            "response": {"output_text": "Küche"},
+        }
+    ]
+    assert _completed_indices_from_temp(temp) == {1}
+
+
+@pytest.mark.unit
+def test_additional_formats_run_in_threads_and_report_each(tmp_path: Path):
+    import threading
+    from unittest.mock import MagicMock
+
+    from modules.extract.file_processor import FileProcessor
+
+    loop_thread = threading.get_ident()
+    threads: dict[str, int] = {}
+
+    class Handler:
+        def convert_to_csv(self, src, dest):
+            threads["csv"] = threading.get_ident()
+            raise ValueError("bad csv")
+
+        def convert_to_docx(self, src, dest):  # pragma: no cover - disabled
+            raise AssertionError("docx_output is off")
+
+        def convert_to_txt(self, src, dest):
+            threads["txt"] = threading.get_ident()
+            dest.write_text("ok", encoding="utf-8")
+
+    messenger = MagicMock()
+    out = tmp_path / "doc_output.json"
+    asyncio.run(
+        FileProcessor._generate_additional_formats(
+            None,
+            out,
+            Handler(),
+            {"csv_output": True, "docx_output": False, "txt_output": True},
+            messenger,
+        )
+    )
+
+    assert set(threads) == {"csv", "txt"}
+    assert loop_thread not in threads.values()
+    assert (tmp_path / "doc_output.txt").read_text(encoding="utf-8") == "ok"
+    messenger.warning.assert_called_once_with("Failed to generate CSV output: bad csv")
+    messenger.info.assert_called_once_with(
+        f"TXT output saved to {tmp_path / 'doc_output.txt'}"
+    )
+
+
+def test_additional_formats_extract_entries_once(tmp_path: Path, monkeypatch):
+    from unittest.mock import MagicMock
+
+    import modules.extract.file_processor as fp_module
+    from modules.extract.file_processor import FileProcessor
+
+    parsed: list[Path] = []
+    received: dict[str, object] = {}
+
+    def _extract(json_file):
+        parsed.append(json_file)
+        return [{"id": 1}]
+
+    class Handler:
+        def convert_to_csv(self, src, dest, entries=None):
+            received["csv"] = entries
+
+        def convert_to_txt(self, src, dest, entries=None):
+            received["txt"] = entries
+
+        def convert_to_docx(self, src, dest):
+            # A two-argument custom converter still works unchanged.
+            received["docx"] = "legacy"
+
+    monkeypatch.setattr(fp_module, "extract_entries_from_json", _extract)
+    out = tmp_path / "doc_output.json"
+    asyncio.run(
+        FileProcessor._generate_additional_formats(
+            None,
+            out,
+            Handler(),
+            {"csv_output": True, "docx_output": True, "txt_output": True},
+            MagicMock(),
+        )
+    )
+
+    assert parsed == [out]
+    assert received == {"csv": [{"id": 1}], "txt": [{"id": 1}], "docx": "legacy"}
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("threshold", "expected_batch"), [(3, True), (4, False), (0, False)]
+)
+def test_auto_batch_threshold_routes_large_text_runs_to_batch(
+    tmp_path: Path, config_loader, monkeypatch, threshold, expected_batch
+):
+    from modules.extract.file_processor import FileProcessor
+
+    seen: list[bool] = []
+
+    def _strategy(use_batch, concurrency_config=None):
+        seen.append(use_batch)
+        return DummyStrategy()
+
+    monkeypatch.setattr(
+        "modules.extract.file_processor.create_processing_strategy", _strategy
+    )
+    monkeypatch.setattr(
+        "modules.extract.file_processor.get_schema_handler",
+        lambda schema_name: DummyHandler(),
+    )
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("a\nb\nc\n", encoding="utf-8")
+    (tmp_path / "input_line_ranges.txt").write_text(
+        "(1, 1)\n(2, 2)\n(3, 3)\n", encoding="utf-8"
+    )
+    schema_paths = config_loader.get_schemas_paths()["TestSchema"]
+
+    fp = FileProcessor(
+        paths_config=config_loader.get_paths_config(),
+        model_config=config_loader.get_model_config(),
+        chunking_config={"chunking": {"auto_batch_threshold": threshold}},
+        concurrency_config=config_loader.get_concurrency_config(),
+    )
+
+    status = asyncio.run(
+        fp.process_file(
+            file_path=input_file,
+            use_batch=False,
+            selected_schema={"schema": {"type": "object"}},
+            prompt_template="Schema={{TRANSCRIPTION_SCHEMA}}",
+            schema_name="TestSchema",
+            inject_schema=True,
+            schema_paths=schema_paths,
+            global_chunking_method="line_ranges.txt",
+            ui=None,
+        )
+    )
+
+    assert seen == [expected_batch]
+    # A switched file is only submitted, never reported as complete.
+    assert status == ("submitted" if expected_batch else "complete")
+
+
+@pytest.mark.unit
+def test_invalid_auto_batch_threshold_disables_switch(config_loader):
+    from modules.extract.file_processor import FileProcessor
+
+    fp = FileProcessor(
+        paths_config=config_loader.get_paths_config(),
+        model_config=config_loader.get_model_config(),
+        chunking_config={"chunking": {"auto_batch_threshold": "lots"}},
+    )
+
+    assert fp._auto_batch_threshold == 0
+
+
+def test_additional_formats_missing_converter_fails_only_that_format(
+    tmp_path: Path,
+):
+    from unittest.mock import MagicMock
+
+    from modules.extract.file_processor import FileProcessor
+
+    class Handler:
+        # No convert_to_csv: a custom handler that only supports TXT.
+        def convert_to_txt(self, src, dest):
+            dest.write_text("ok", encoding="utf-8")
+
+    messenger = MagicMock()
+    out = tmp_path / "doc_output.json"
+    asyncio.run(
+        FileProcessor._generate_additional_formats(
+            None,
+            out,
+            Handler(),
+            {"csv_output": True, "txt_output": True},
+            messenger,
+        )
+    )
+
+    assert (tmp_path / "doc_output.txt").read_text(encoding="utf-8") == "ok"
+    (warning,) = messenger.warning.call_args_list
+    assert warning.args[0].startswith("Failed to generate CSV output:")
+    messenger.info.assert_called_once_with(
+        f"TXT output saved to {tmp_path / 'doc_output.txt'}"
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("dropped", "threshold", "expected"),
+    [
+        ((), 1, ("skipped", [])),
+        ((2,), 2, ("complete", [False])),
+        ((2,), 1, ("submitted", [True])),
+    ],
+)
+def test_auto_batch_threshold_counts_only_pending_chunks_on_resume(
+    tmp_path: Path, config_loader, monkeypatch, dropped, threshold, expected
+):
+    from modules.extract.file_processor import FileProcessor
+
+    seen: list[bool] = []
+
+    def _strategy(use_batch, concurrency_config=None):
+        seen.append(use_batch)
+        return DummyStrategy()
+
+    monkeypatch.setattr(
+        "modules.extract.file_processor.create_processing_strategy", _strategy
+    )
+    monkeypatch.setattr(
+        "modules.extract.file_processor.get_schema_handler",
+        lambda schema_name: DummyHandler(),
+    )
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("a\nb\nc\n", encoding="utf-8")
+    (tmp_path / "input_line_ranges.txt").write_text(
+        "(1, 1)\n(2, 2)\n(3, 3)\n", encoding="utf-8"
+    )
+    schema_paths = config_loader.get_schemas_paths()["TestSchema"]
+
+    def _run(auto_batch_threshold: int, resume: bool) -> str:
+        fp = FileProcessor(
+            paths_config=config_loader.get_paths_config(),
+            model_config=config_loader.get_model_config(),
+            chunking_config={
+                "chunking": {"auto_batch_threshold": auto_batch_threshold}
+            },
+            concurrency_config=config_loader.get_concurrency_config(),
+        )
+        return asyncio.run(
+            fp.process_file(
+                file_path=input_file,
+                use_batch=False,
+                selected_schema={"schema": {"type": "object"}},
+                prompt_template="Schema={{TRANSCRIPTION_SCHEMA}}",
+                schema_name="TestSchema",
+                inject_schema=True,
+                schema_paths=schema_paths,
+                global_chunking_method="line_ranges.txt",
+                ui=None,
+                resume=resume,
+            )
+        )
+
+    _run(0, resume=False)
+    seen.clear()
+    output_path = next((tmp_path / "output").glob("*_output.json"))
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    data["records"] = [
+        r
+        for r in data["records"]
+        if not any(r["custom_id"].endswith(f"-chunk-{i}") for i in dropped)
+    ]
+    output_path.write_text(json.dumps(data), encoding="utf-8")
+    for temp in tmp_path.rglob("*_temp.jsonl"):
+        temp.unlink()
+
+    # The already-extracted chunks never count toward the threshold: a fully
+    # processed file is skipped, and one pending chunk stays synchronous
+    # unless the threshold is 1.
+    assert (_run(threshold, resume=True), seen) == expected
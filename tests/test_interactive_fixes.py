@@ -57,6 +57,21 @@ def test_summary_success_only_when_clean() -> None:
     assert "All 3 file(s) processed successfully!" in text
 
 
+@pytest.mark.unit
+def test_summary_reports_auto_batched_files_as_submitted() -> None:
+    text = _capture_summary(
+        processed_count=1,
+        failed_count=0,
+        use_batch=False,
+        complete_count=1,
+        submitted_count=2,
+    )
+    assert "processed successfully" not in text
+    assert "Complete: 1/3 file(s)" in text
+    assert "Batch:    2 file(s) submitted" in text
+    assert "check_batches.py" in text
+
+
 @pytest.mark.unit
 def test_summary_no_success_line_when_failure() -> None:
     text = _capture_summary(
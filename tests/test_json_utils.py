@@ -27,6 +27,27 @@ def test_extract_entries_direct_format(tmp_path):
     assert entries[1]["name"] == "entry2"
 
 
+@pytest.mark.unit
+def test_converter_uses_pre_extracted_entries(tmp_path, monkeypatch):
+    """Entries handed to a converter are used as-is; the output JSON is not
+    read again for each format."""
+    import modules.conversion.base as base
+    from modules.conversion.csv_converter import CSVConverter
+
+    monkeypatch.setattr(
+        base,
+        "extract_entries_from_json",
+        lambda json_file: pytest.fail("entries were re-extracted"),
+    )
+    output_csv = tmp_path / "out.csv"
+
+    CSVConverter("Unregistered").convert_to_csv(
+        tmp_path / "missing.json", output_csv, entries=[{"id": 1}, None]
+    )
+
+    assert output_csv.read_text(encoding="utf-8-sig").splitlines() == ["id", "1"]
+
+
 @pytest.mark.unit
 def test_extract_entries_with_no_content_flag(tmp_path):
     json_file = tmp_path / "no_content.json"
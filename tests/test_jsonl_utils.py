@@ -9,6 +9,8 @@ import pytest
 from modules.infra.jsonl import (
     JsonlWriter,
     extract_completed_ids,
+    fast_json_dumps,
+    fast_json_loads,
     read_jsonl_records,
 )
 
@@ -179,3 +181,30 @@ class TestExtractCompletedIds:
         )
         ids = extract_completed_ids(path)
         assert ids == {1}
+
+
+# ---------------------------------------------------------------------------
+# fast_json_loads / fast_json_dumps
+# ---------------------------------------------------------------------------
+
+
+class TestFastJson:
+    def test_dumps_matches_stdlib_compact_output(self) -> None:
+        obj = {"type": "object", "title": "Café", "items": [1, True, None]}
+        expected = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        assert fast_json_dumps(obj) == expected
+
+    def test_dumps_non_string_keys_fall_back_to_stdlib(self) -> None:
+        assert fast_json_dumps({1: "a"}) == '{"1":"a"}'
+
+    def test_loads_accepts_str_and_bytes(self) -> None:
+        assert fast_json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert fast_json_loads('{"a": "é"}'.encode()) == {"a": "é"}
+
+    def test_loads_nan_literal_falls_back_to_stdlib(self) -> None:
+        value = fast_json_loads('{"x": NaN}')["x"]
+        assert value != value
+
+    def test_loads_malformed_raises_json_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            fast_json_loads("{not json")
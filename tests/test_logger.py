@@ -49,6 +49,28 @@ class TestSetupLogger:
 
         assert logger.level == logging.INFO
 
+    @pytest.mark.unit
+    def test_log_file_resolved_once(self, monkeypatch, tmp_path):
+        """Repeated setup_logger calls reuse the resolved log file path."""
+        import modules.infra.logger as logger_module
+
+        calls = []
+
+        def _counting_resolve():
+            calls.append(1)
+            return tmp_path
+
+        logger_module._log_file.cache_clear()
+        monkeypatch.setattr(logger_module, "_resolve_logs_dir", _counting_resolve)
+        try:
+            setup_logger("resolve_once_a")
+            setup_logger("resolve_once_b")
+            assert logger_module._log_file() == tmp_path / "application.log"
+        finally:
+            logger_module._log_file.cache_clear()
+
+        assert len(calls) == 1
+
 
 class TestResolveLogsDir:
     """Tests for _resolve_logs_dir function."""
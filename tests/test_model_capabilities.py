@@ -71,6 +71,32 @@ class TestDetectProvider:
         assert detect_provider("CLAUDE-3.5-sonnet") == "anthropic"
         assert detect_provider("Gemini-2.0-flash") == "google"
 
+    @pytest.mark.unit
+    def test_detect_provider_is_memoized(self):
+        """Repeated lookups for one model hit the cache."""
+        detect_provider.cache_clear()
+        assert detect_provider("claude-sonnet-4-5") == "anthropic"
+        assert detect_provider("claude-sonnet-4-5") == "anthropic"
+
+        info = detect_provider.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+
+class TestCapabilityCache:
+    """Every model seen in a run is resolved once."""
+
+    @pytest.mark.unit
+    def test_models_are_resolved_once(self):
+        from modules.config.capabilities import detection
+
+        detection._resolve_capabilities.cache_clear()
+
+        first = detect_capabilities("claude-sonnet-4-5")
+        assert detect_capabilities("claude-sonnet-4-5", provider="anthropic") is first
+        assert detect_capabilities("claude-sonnet-4-5", provider="custom") is not first
+        assert detection._resolve_capabilities.cache_info().misses == 2
+
 
 class TestDetectCapabilities:
     """Test capability detection for different models."""
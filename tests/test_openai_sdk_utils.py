@@ -1,9 +1,21 @@
-from unittest.mock import MagicMock, Mock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
-from modules.llm.openai_sdk_utils import coerce_file_id, list_all_batches, sdk_to_dict
-from modules.llm.openai_utils import _normalize_structured_schema
+from modules.llm.openai_sdk_utils import (
+    coerce_file_id,
+    list_all_batches,
+    sdk_to_dict,
+)
+from modules.llm.openai_utils import (
+    _build_messages,
+    _normalize_structured_schema,
+    _structured_schema_for,
+    _system_frame_for,
+    process_many,
+    process_text_chunks,
+)
 
 
 class _Caps:
@@ -37,6 +49,76 @@ def test_normalize_structured_schema_keeps_explicit_name():
     assert result["name"] == "BibliographicEntries"
 
 
+@pytest.mark.unit
+def test_structured_schema_for_reuses_normalized_schema_per_object():
+    extractor = Mock(caps=_Caps(), _structured_schema_cache=None)
+    schema = {"name": "Entries", "schema": {"type": "object"}}
+
+    first = _structured_schema_for(extractor, schema)
+    second = _structured_schema_for(extractor, schema)
+    other = _structured_schema_for(extractor, {"type": "array"})
+
+    assert first is second
+    assert first == {"name": "Entries", "schema": {"type": "object"}, "strict": True}
+    assert other is not None
+    assert other["schema"] == {"type": "array"}
+
+
+@pytest.mark.unit
+def test_system_frame_for_reuses_frame_for_same_prompt():
+    extractor = Mock(_system_frame_cache=None)
+
+    first = _system_frame_for(extractor, "You extract.", True)
+    second = _system_frame_for(extractor, "You extract.", True)
+    uncached = _system_frame_for(extractor, "You extract.", False)
+
+    assert first is second
+    assert first == {
+        "role": "system",
+        "content": [
+            {
+                "type": "input_text",
+                "text": "You extract.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+    }
+    assert uncached["content"] == [{"type": "input_text", "text": "You extract."}]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("system_message", [None, ""])
+def test_build_messages_omits_empty_system_message(system_message):
+    extractor = Mock(provider="openai", _system_frame_cache=None)
+    user_blocks = [{"type": "input_text", "text": "chunk"}]
+
+    messages = _build_messages(
+        system_message,
+        user_blocks,
+        extractor=extractor,
+        enable_cache_control=True,
+        context_image_data=None,
+    )
+
+    assert messages == [{"role": "user", "content": user_blocks}]
+
+
+@pytest.mark.unit
+def test_build_messages_puts_system_message_first():
+    extractor = Mock(provider="openai", _system_frame_cache=None)
+
+    messages = _build_messages(
+        "You extract.",
+        [{"type": "input_text", "text": "chunk"}],
+        extractor=extractor,
+        enable_cache_control=False,
+        context_image_data=None,
+    )
+
+    assert [m["role"] for m in messages] == ["system", "user"]
+    assert messages[0]["content"] == [{"type": "input_text", "text": "You extract."}]
+
+
 @pytest.mark.unit
 def test_sdk_to_dict_with_plain_dict():
     obj = {"key": "value", "number": 42}
@@ -92,6 +174,66 @@ def test_sdk_to_dict_with_attributes():
     assert "_private" not in result
 
 
+@pytest.mark.unit
+def test_sdk_to_dict_dumps_pydantic_models_directly():
+    from pydantic import BaseModel
+
+    class Batch(BaseModel):
+        id: str
+        status: str = "completed"
+
+    assert sdk_to_dict(Batch(id="batch_1")) == {
+        "id": "batch_1",
+        "status": "completed",
+    }
+
+
+@pytest.mark.unit
+def test_sdk_to_dict_reuses_converter_per_class():
+    class Item:
+        probes = 0
+
+        def __init__(self, value):
+            self.value = value
+
+        def __getattribute__(self, name):
+            if name == "model_dump":
+                type(self).probes += 1
+            return object.__getattribute__(self, name)
+
+        def to_dict(self):
+            return {"value": self.value}
+
+    assert sdk_to_dict(Item(1)) == {"value": 1}
+    probes_after_first = Item.probes
+    assert [sdk_to_dict(Item(i)) for i in range(2, 5)] == [
+        {"value": 2},
+        {"value": 3},
+        {"value": 4},
+    ]
+
+    assert probes_after_first == 1
+    assert Item.probes == probes_after_first
+
+
+@pytest.mark.unit
+def test_sdk_to_dict_falls_back_when_cached_converter_fails():
+    class Item:
+        def __init__(self, broken):
+            self.broken = broken
+
+        def model_dump(self):
+            if self.broken:
+                raise ValueError("cannot dump")
+            return {"via": "model_dump"}
+
+        def to_dict(self):
+            return {"via": "to_dict"}
+
+    assert sdk_to_dict(Item(False)) == {"via": "model_dump"}
+    assert sdk_to_dict(Item(True)) == {"via": "to_dict"}
+
+
 @pytest.mark.unit
 def test_list_all_batches_single_page():
     mock_client = Mock()
@@ -142,6 +284,20 @@ def test_list_all_batches_multiple_pages():
     assert mock_client.batches.list.call_count == 2
 
 
+@pytest.mark.unit
+def test_list_all_batches_dict_pages():
+    pages = {
+        None: {"data": [{"id": "batch_1"}], "has_more": True, "last_id": "batch_1"},
+        "batch_1": {"data": [{"id": "batch_2"}], "has_more": False},
+    }
+    mock_client = Mock()
+    mock_client.batches.list = Mock(side_effect=lambda limit, after=None: pages[after])
+
+    result = list_all_batches(mock_client, limit=1)
+
+    assert result == [{"id": "batch_1"}, {"id": "batch_2"}]
+
+
 @pytest.mark.unit
 def test_coerce_file_id_with_string():
     result = coerce_file_id("file-123")
@@ -211,3 +367,222 @@ def test_list_all_batches_empty_result():
     result = list_all_batches(mock_client)
 
     assert len(result) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extractor_create_reads_prompt_off_the_event_loop(tmp_path, monkeypatch):
+    import threading
+
+    import modules.llm.openai_utils as ou
+
+    prompt_file = tmp_path / "prompt.txt"
+    prompt_file.write_text("  Extract entries.  \n", encoding="utf-8")
+    reader_threads = []
+    real_read = ou._read_prompt
+
+    def _recording_read(path):
+        reader_threads.append(threading.get_ident())
+        return real_read(path)
+
+    monkeypatch.setattr(ou, "_read_prompt", _recording_read)
+
+    extractor = await ou.LLMExtractor.create(
+        api_key="sk-test",
+        prompt_path=prompt_file,
+        model="gpt-4o",
+        model_config_override={"extraction_model": {"name": "gpt-4o"}},
+        concurrency_config_override={"concurrency": {}},
+    )
+
+    assert extractor.prompt_text == "Extract entries."
+    assert reader_threads and reader_threads[0] != threading.get_ident()
+
+
+def _chunk_batch_extractor(outputs):
+    llm = Mock()
+    llm.ainvoke_with_structured_output = AsyncMock(
+        side_effect=[
+            {"output_text": out, "response_data": {"usage": {"total_tokens": 9}}}
+            for out in outputs
+        ]
+    )
+    return Mock(
+        provider="openai",
+        caps=_Caps(),
+        llm=llm,
+        _structured_schema_cache=None,
+        _system_frame_cache=None,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_text_chunks_packs_chunks_into_one_call():
+    schema = {
+        "name": "Entries",
+        "schema": {
+            "type": "object",
+            "properties": {"entry": {"$ref": "#/$defs/Entry"}},
+            "$defs": {"Entry": {"type": "string"}},
+        },
+    }
+    extractor = _chunk_batch_extractor(
+        ['{"results": [{"entry": "a"}, {"entry": "b"}]}']
+    )
+
+    results = await process_text_chunks(
+        ["first", "second"], extractor, system_message="sys", json_schema=schema
+    )
+
+    call = extractor.llm.ainvoke_with_structured_output.await_args.kwargs
+    batched = call["json_schema"]
+    assert batched["name"] == "EntriesBatch"
+    assert batched["schema"]["$defs"] == {"Entry": {"type": "string"}}
+    assert "$defs" not in batched["schema"]["properties"]["results"]["items"]
+    user_texts = [block["text"] for block in call["messages"][-1]["content"]]
+    assert user_texts[1:] == [
+        '<chunk id="0">\nfirst\n</chunk>',
+        '<chunk id="1">\nsecond\n</chunk>',
+    ]
+    assert [r["output_text"] for r in results] == ['{"entry":"a"}', '{"entry":"b"}']
+    assert results[0]["usage"] == {"total_tokens": 9}
+    assert results[1]["usage"] == {}
+    assert results[1]["response_data"]["batch_index"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_text_chunks_falls_back_on_result_count_mismatch():
+    extractor = _chunk_batch_extractor(
+        ['{"results": [{"entry": "a"}]}', '{"entry": "a"}', '{"entry": "b"}']
+    )
+
+    results = await process_text_chunks(
+        ["first", "second"], extractor, json_schema={"type": "object"}
+    )
+
+    assert extractor.llm.ainvoke_with_structured_output.await_count == 3
+    assert [r["output_text"] for r in results] == ['{"entry": "a"}', '{"entry": "b"}']
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_text_chunks_falls_back_on_unparseable_output():
+    extractor = _chunk_batch_extractor(["not json", '{"entry": "a"}', '{"entry": "b"}'])
+
+    results = await process_text_chunks(
+        ["first", "second"], extractor, json_schema={"type": "object"}
+    )
+
+    assert extractor.llm.ainvoke_with_structured_output.await_count == 3
+    assert [r["output_text"] for r in results] == ['{"entry": "a"}', '{"entry": "b"}']
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_text_chunks_propagates_call_errors():
+    extractor = _chunk_batch_extractor([])
+    extractor.llm.ainvoke_with_structured_output.side_effect = RuntimeError(
+        "429 rate limit exceeded"
+    )
+
+    # A rate-limited batched call is left to the caller's retry loop rather
+    # than re-sent as one call per chunk.
+    with pytest.raises(RuntimeError, match="429"):
+        await process_text_chunks(
+            ["first", "second"], extractor, json_schema={"type": "object"}
+        )
+
+    assert extractor.llm.ainvoke_with_structured_output.await_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_many_bounds_in_flight_calls(monkeypatch):
+    import modules.llm.openai_utils as ou
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_process(text_chunk, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 if text_chunk == "c0" else 0)
+        in_flight -= 1
+        return {"output_text": text_chunk}
+
+    monkeypatch.setattr(ou, "process_text_chunk", fake_process)
+    extractor = Mock(concurrency_config={})
+
+    results = [
+        pair
+        async for pair in process_many(
+            (f"c{i}" for i in range(7)), extractor, concurrency=2
+        )
+    ]
+
+    assert peak == 2
+    assert sorted(results) == [(i, {"output_text": f"c{i}"}) for i in range(7)]
+    assert results[-1] == (0, {"output_text": "c0"})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_many_defaults_to_configured_limit_and_cancels_on_error(
+    monkeypatch,
+):
+    import modules.llm.openai_utils as ou
+
+    started = []
+    cancelled = []
+
+    async def fake_process(text_chunk, **kwargs):
+        started.append(text_chunk)
+        if text_chunk == "bad":
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(text_chunk)
+            raise
+        return {}
+
+    monkeypatch.setattr(ou, "process_text_chunk", fake_process)
+    extractor = Mock(
+        concurrency_config={"concurrency": {"extraction": {"concurrency_limit": 3}}}
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in process_many(["a", "bad", "b", "c"], extractor):
+            pass
+
+    assert started == ["a", "bad", "b"]
+    assert sorted(cancelled) == ["a", "b"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_many_retrieves_every_failed_sibling(monkeypatch):
+    import gc
+
+    import modules.llm.openai_utils as ou
+
+    async def fake_process(text_chunk, **kwargs):
+        raise RuntimeError(text_chunk)
+
+    unretrieved = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+    monkeypatch.setattr(ou, "process_text_chunk", fake_process)
+
+    try:
+        with pytest.raises(RuntimeError):
+            async for _ in process_many(["a", "b", "c"], Mock(), concurrency=3):
+                pass
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unretrieved == []
@@ -1285,3 +1285,162 @@ async def test_batch_custom_ids_are_sanitized_end_to_end(
         if line.strip()
     ]
     assert lines[0]["batch_request"]["custom_id"] == submitted_id
+
+
+@pytest.mark.asyncio
+async def test_synchronous_strategy_response_cache_skips_repeated_chunks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """With response_cache on, an identical chunk reuses the first response
+    instead of calling the API again, and is still persisted under its own
+    chunk index."""
+    monkeypatch.setattr(
+        ps.ProviderConfig, "_detect_provider", staticmethod(lambda model: "openai")
+    )
+    monkeypatch.setattr(
+        ps.ProviderConfig, "_get_api_key", staticmethod(lambda provider: "key")
+    )
+    monkeypatch.setattr(
+        ps, "open_extractor", lambda **_kwargs: _AsyncExtractorCM(object())
+    )
+    monkeypatch.setattr(ps, "_RESPONSE_CACHE", {})
+    monkeypatch.setattr(
+        ps.TextProcessor, "estimate_tokens", staticmethod(lambda text: len(text))
+    )
+
+    calls: list[str] = []
+
+    async def _process_text_chunk(*, text_chunk: str, **kwargs):
+        calls.append(text_chunk)
+        usage = {"total_tokens": 7}
+        return {
+            "output_text": f"out:{text_chunk}",
+            "response_data": {"usage": usage},
+            "usage": usage,
+        }
+
+    monkeypatch.setattr(ps, "process_text_chunk", _process_text_chunk)
+
+    temp_jsonl = tmp_path / "temp.jsonl"
+    strat = ps.SynchronousProcessingStrategy(
+        concurrency_config={
+            "concurrency": {
+                "extraction": {"concurrency_limit": 1, "response_cache": True}
+            }
+        }
+    )
+
+    await strat.process_chunks(
+        chunks=["header", "header", "body"],
+        handler=_DummyHandler(),
+        dev_message="dev",
+        model_config={"extraction_model": {"name": "gpt-4o"}},
+        schema={"type": "object"},
+        file_path=tmp_path / "input.txt",
+        temp_jsonl_path=temp_jsonl,
+        console_print=lambda *_args, **_kwargs: None,
+    )
+
+    assert calls == ["header", "body"]
+    records = {
+        rec["chunk_index"]: rec["response"]["body"]["output_text"]
+        for line in temp_jsonl.read_text(encoding="utf-8").splitlines()
+        if "custom_id" in (rec := json.loads(line))
+    }
+    assert records == {1: "out:header", 2: "out:header", 3: "out:body"}
+    # The replayed record is flagged and carries no usage of its own, so the
+    # tokens billed once for "header" are not counted twice.
+    by_index = {
+        rec["chunk_index"]: rec
+        for line in temp_jsonl.read_text(encoding="utf-8").splitlines()
+        if "custom_id" in (rec := json.loads(line))
+    }
+    assert [i for i, rec in by_index.items() if rec.get("cached")] == [2]
+    assert by_index[2]["response"]["body"]["usage"] == {}
+    assert "usage" not in by_index[2]["response"]["body"]["response_data"]
+    assert by_index[1]["response"]["body"]["usage"] == {"total_tokens": 7}
+
+
+def test_response_cache_key_tracks_model_settings_and_stores_copies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(ps, "_RESPONSE_CACHE", {})
+    schema = {"type": "object"}
+    cold = SimpleNamespace(provider="openai", model="gpt-4o", temperature=0.0)
+    warm = SimpleNamespace(provider="openai", model="gpt-4o", temperature=0.7)
+    other = SimpleNamespace(provider="openrouter", model="gpt-4o", temperature=0.0)
+
+    def key(extractor: object) -> str:
+        return ps._response_cache_key(
+            ps._response_cache_scope(extractor, schema), "dev", "chunk"
+        )
+
+    assert key(cold) == key(SimpleNamespace(**vars(cold)))
+    assert len({key(cold), key(warm), key(other)}) == 3
+
+    result = {"output_text": "x", "response_data": {"entries": [1]}}
+    ps._remember_response(key(cold), result)
+    result["response_data"]["entries"].append(2)
+    assert ps._RESPONSE_CACHE[key(cold)]["response_data"] == {"entries": [1]}
+
+
+@pytest.mark.asyncio
+async def test_synchronous_strategy_token_estimate_counts_system_prompt(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The token windows are charged for the system prompt sent with every
+    chunk, not just the chunk text and output ceiling."""
+    from types import SimpleNamespace
+
+    from modules.infra.rate_limit import RateLimiter
+
+    monkeypatch.setattr(
+        ps.ProviderConfig, "_detect_provider", staticmethod(lambda model: "openai")
+    )
+    monkeypatch.setattr(
+        ps.ProviderConfig, "_get_api_key", staticmethod(lambda provider: "key")
+    )
+    monkeypatch.setattr(
+        ps,
+        "open_extractor",
+        lambda **_kwargs: _AsyncExtractorCM(SimpleNamespace(max_output_tokens=100)),
+    )
+    monkeypatch.setattr(
+        ps,
+        "get_shared_rate_limiter",
+        lambda provider: RateLimiter([(1000, 1)], token_limits=[(10**9, 60)]),
+    )
+    monkeypatch.setattr(
+        ps.TextProcessor, "estimate_tokens", staticmethod(lambda text: len(text))
+    )
+
+    charged: list[int] = []
+
+    async def _await_capacity(limiter, tokens=0):
+        charged.append(tokens)
+        return 0.0
+
+    async def _process_text_chunk(*, text_chunk: str, **kwargs):
+        return {"output_text": "ok"}
+
+    monkeypatch.setattr(ps, "await_capacity", _await_capacity)
+    monkeypatch.setattr(ps, "process_text_chunk", _process_text_chunk)
+
+    strat = ps.SynchronousProcessingStrategy(
+        concurrency_config={"concurrency": {"extraction": {"concurrency_limit": 1}}}
+    )
+    await strat.process_chunks(
+        chunks=["x" * 40],
+        handler=_DummyHandler(),
+        dev_message="d" * 400,
+        model_config={"extraction_model": {"name": "gpt-4o"}},
+        schema={"type": "object"},
+        file_path=tmp_path / "input.txt",
+        temp_jsonl_path=tmp_path / "temp.jsonl",
+        console_print=lambda *_args, **_kwargs: None,
+    )
+
+    # 400 prompt chars + 40 chunk chars at 4 chars/token, plus the ceiling.
+    assert charged == [100 + 10 + 100]
@@ -149,6 +149,50 @@ class TestRenderPromptWithSchema:
 
         assert "{{CONTEXT}}" not in rendered
 
+    @pytest.mark.unit
+    def test_placeholder_free_prompt_returned_unchanged(self):
+        """Nothing to substitute and no schema: the prompt passes through."""
+        prompt = "Plain prompt.\nContext: none here"
+        rendered = render_prompt_with_schema(
+            prompt, {"type": "object"}, inject_schema=False, context="ctx"
+        )
+
+        assert rendered is prompt
+
+    @pytest.mark.unit
+    def test_replaces_existing_schema_after_marker(self):
+        """An inline schema after the marker is swapped, trailing prose kept."""
+        prompt = 'The JSON schema:\n{"old": {"x": 1}}\nReply {briefly}.'
+        rendered = render_prompt_with_schema(
+            prompt, {"type": "object"}, inject_schema=True
+        )
+
+        assert rendered == 'The JSON schema:\n{"type":"object"}\nReply {briefly}.'
+
+    @pytest.mark.unit
+    def test_schema_serialization_is_memoized_per_object(self, monkeypatch):
+        """Repeated renders with one schema dict serialize it only once."""
+        import modules.llm.prompt_utils as pu
+
+        calls = []
+        real_dumps = pu.fast_json_dumps
+
+        def counting_dumps(obj):
+            calls.append(obj)
+            return real_dumps(obj)
+
+        monkeypatch.setattr(pu, "fast_json_dumps", counting_dumps)
+        schema = {"type": "object", "properties": {"x": {"type": "string"}}}
+        first = render_prompt_with_schema("S={{TRANSCRIPTION_SCHEMA}}", schema)
+        second = render_prompt_with_schema("S={{TRANSCRIPTION_SCHEMA}}", schema)
+        other = render_prompt_with_schema(
+            "S={{TRANSCRIPTION_SCHEMA}}", {"type": "array"}
+        )
+
+        assert first == second
+        assert other == 'S={"type":"array"}'
+        assert [c for c in calls if c is schema] == [schema]
+
 
 class TestLoadPromptTemplate:
     """Tests for load_prompt_template function."""
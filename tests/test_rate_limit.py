@@ -12,8 +12,10 @@ from modules.infra.rate_limit import (
     MAX_ERROR_MULTIPLIER,
     RateLimiter,
     await_capacity,
+    estimate_request_tokens,
     get_rate_limits,
     get_shared_rate_limiter,
+    get_token_rate_limits,
     reset_shared_rate_limiters,
 )
 
@@ -238,3 +240,71 @@ async def test_await_capacity_runs_off_loop():
     waited = await await_capacity(limiter)
     assert waited >= 0.0
     assert limiter.total_requests == 1
+
+
+@pytest.mark.unit
+def test_estimate_request_tokens():
+    assert estimate_request_tokens("x" * 400, 1000) == 1100
+    assert estimate_request_tokens("", 512) == 512
+
+
+@pytest.mark.unit
+def test_token_window_delays_request_over_budget():
+    # 1000 tokens per second; 600 + 600 exceeds it, so the second call waits
+    # for the first to leave the window.
+    limiter = RateLimiter([(1000, 1)], token_limits=[(1000, 1)])
+    limiter.wait_for_capacity(tokens=600)
+
+    start = time.monotonic()
+    limiter.wait_for_capacity(tokens=600)
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.5
+    assert limiter.token_totals == [600]
+
+
+@pytest.mark.unit
+def test_token_window_admits_oversized_request_when_empty():
+    limiter = RateLimiter([(1000, 1)], token_limits=[(100, 60)])
+
+    start = time.monotonic()
+    limiter.wait_for_capacity(tokens=500)
+
+    assert time.monotonic() - start < 0.5
+    assert limiter.get_stats()["current_token_usage"] == [500]
+
+
+@pytest.mark.unit
+def test_zero_token_requests_ignore_token_windows():
+    limiter = RateLimiter([(1000, 1)], token_limits=[(10, 60)])
+    limiter.wait_for_capacity(tokens=10)
+
+    start = time.monotonic()
+    limiter.wait_for_capacity()
+
+    assert time.monotonic() - start < 0.5
+    assert limiter.token_totals == [10]
+
+
+@pytest.mark.unit
+def test_get_token_rate_limits_reads_config(monkeypatch):
+    class _Loader:
+        def get_concurrency_config(self):
+            return {"concurrency": {"token_rate_limits": [[90000, 60], [0, 60]]}}
+
+    monkeypatch.setattr(
+        "modules.config.loader.get_config_loader", lambda *a, **k: _Loader()
+    )
+    assert get_token_rate_limits() == [(90000, 60)]
+
+
+@pytest.mark.unit
+def test_get_token_rate_limits_disabled_when_absent(monkeypatch):
+    class _Loader:
+        def get_concurrency_config(self):
+            return {"concurrency": {"rate_limits": [[10, 1]]}}
+
+    monkeypatch.setattr(
+        "modules.config.loader.get_config_loader", lambda *a, **k: _Loader()
+    )
+    assert get_token_rate_limits() == []
@@ -30,7 +30,9 @@ class TestBaseSchemaHandler:
             mock_csv.return_value = mock_instance
             handler.convert_to_csv(json_file, csv_file)
             mock_csv.assert_called_once_with("TestSchema")
-            mock_instance.convert_to_csv.assert_called_once_with(json_file, csv_file)
+            mock_instance.convert_to_csv.assert_called_once_with(
+                json_file, csv_file, entries=None
+            )
 
     def test_convert_to_docx(self, tmp_path):
         handler = BaseSchemaHandler("TestSchema")
@@ -42,7 +44,9 @@ class TestBaseSchemaHandler:
             mock_doc.return_value = mock_instance
             handler.convert_to_docx(json_file, docx_file)
             mock_doc.assert_called_once_with("TestSchema")
-            mock_instance.convert_to_docx.assert_called_once_with(json_file, docx_file)
+            mock_instance.convert_to_docx.assert_called_once_with(
+                json_file, docx_file, entries=None
+            )
 
     def test_convert_to_txt(self, tmp_path):
         handler = BaseSchemaHandler("TestSchema")
@@ -54,7 +58,9 @@ class TestBaseSchemaHandler:
             mock_doc.return_value = mock_instance
             handler.convert_to_txt(json_file, txt_file)
             mock_doc.assert_called_once_with("TestSchema")
-            mock_instance.convert_to_txt.assert_called_once_with(json_file, txt_file)
+            mock_instance.convert_to_txt.assert_called_once_with(
+                json_file, txt_file, entries=None
+            )
 
 
 class TestSchemaHandlerRegistry:
@@ -67,6 +67,22 @@ class TestDetectExtractionStatus:
         assert status == FileStatus.NOT_STARTED
         assert completed == set()
 
+    def test_not_started_when_not_utf8(self, tmp_path: Path):
+        from modules.extract.resume import (
+            FileStatus,
+            completed_indices_from_outputs,
+            detect_extraction_status,
+            read_extraction_metadata,
+        )
+
+        bad_file = tmp_path / "bad_output.json"
+        bad_file.write_bytes(b'{"records": [{"custom_id": "doc-chunk-1\xff"}]}')
+        status, completed = detect_extraction_status(bad_file, expected_chunks=3)
+        assert status == FileStatus.NOT_STARTED
+        assert completed == set()
+        assert read_extraction_metadata(bad_file) is None
+        assert completed_indices_from_outputs(bad_file) == set()
+
     def test_not_started_when_empty_records(self, tmp_path: Path):
         from modules.extract.resume import (
             _METADATA_KEY,
@@ -20,6 +20,51 @@ def test_text_processor_detect_encoding(tmp_path):
     assert isinstance(encoding, str)
 
 
+@pytest.mark.unit
+def test_text_processor_detect_encoding_bytes_matches_path_detection(tmp_path):
+    data = (
+        "Caf\u00e9 cr\u00e8me br\u00fbl\u00e9e, na\u00efve fa\u00e7ade.\n".encode(
+            "cp1252"
+        )
+        * 50
+    )
+    test_file = tmp_path / "test.txt"
+    test_file.write_bytes(data)
+
+    assert TextProcessor.detect_encoding_bytes(data) == TextProcessor.detect_encoding(
+        test_file
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-be", "utf-32"])
+def test_text_processor_detect_encoding_bytes_uses_bom(encoding, monkeypatch):
+    import modules.infra.chunking as chunking
+
+    monkeypatch.setattr(chunking, "_charset_detect", pytest.fail)
+    text = "Küche\nline two\n"
+    data = text.encode(encoding)
+    if encoding == "utf-16-be":
+        data = b"\xfe\xff" + data
+
+    detected = TextProcessor.detect_encoding_bytes(data)
+
+    assert data.decode(detected) == text
+
+
+@pytest.mark.unit
+def test_text_processor_split_lines_matches_text_mode_readlines(tmp_path):
+    text = "a\r\nb\rc\n\fpage\u2028same\n\n  indented  \nlast"
+    test_file = tmp_path / "test.txt"
+    test_file.write_bytes(text.encode("utf-8"))
+    with test_file.open("r", encoding="utf-8") as f:
+        expected = [line.rstrip("\n\r") for line in f.readlines()]
+
+    assert TextProcessor.split_lines(text) == expected
+    assert TextProcessor.split_lines(text + "\n") == expected
+    assert TextProcessor.split_lines("") == []
+
+
 @pytest.mark.unit
 def test_text_processor_normalize_text():
     text = "  hello world  \n\t"